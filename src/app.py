@@ -3,47 +3,140 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import time
+from dataclasses import asdict
 from typing import Optional
 
-import uvicorn
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-from src.dashboard.app import DashboardState, create_dashboard_app
-from src.data.polymarket_client import PolymarketClient
-from src.infra.config import load_config
-from src.infra.logging import configure_logging
-from src.infra.storage import JsonlStore
-from src.pricing.market_arbitrage import MarketArbitrageDetector
-
-import os
-from typing import Any, Dict
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
 
 from src.dashboard.app import InMemoryState, run_dashboard
 from src.data.polymarket_client import PolymarketClient
-from src.infra import logging as logging_setup
 from src.infra.config import load_from_env
-from src.pricing.market_arbitrage import MarketArbitrageDetector
-
-
-async def consume_stream(client: PolymarketClient, detector: MarketArbitrageDetector, state: InMemoryState) -> None:
-    async for message in client.stream():
-        opportunity = detector.ingest(message)
-        if opportunity:
-            state.add_trade(
-                {
-                    "market_id": opportunity.market_id,
-                    "direction": opportunity.direction,
-                    "edge": opportunity.edge,
-                    "notional": opportunity.notional,
-                    "max_size": opportunity.max_size,
-                    "details": opportunity.details,
-                    "ts": asyncio.get_event_loop().time(),
-                }
-            )
+from src.infra.logging import configure_logging
+from src.infra.storage import JsonlStore
+from src.pricing.market_arbitrage import CompleteSetOpportunity, MarketArbitrageDetector
+
+
+AUDIT_BATCH_SIZE = 64
+#: How many queued events the consumer drains per scheduling quantum.
+EVENT_BATCH_SIZE = 64
+EVENT_QUEUE_SIZE = 4096
+#: Minimum spacing between per-opportunity log lines; bursts are aggregated.
+OPPORTUNITY_LOG_INTERVAL_SECONDS = 0.1
+
+
+def _encode_audit(opportunity: "CompleteSetOpportunity") -> bytes:
+    """Encode an opportunity audit record straight to bytes.
+
+    orjson serializes the dataclass in place; the stdlib fallback uses
+    asdict, which works for slotted dataclasses that have no __dict__.
+    """
+
+    if orjson is not None:
+        return orjson.dumps({"type": "opportunity", "data": opportunity}, option=orjson.OPT_SERIALIZE_DATACLASS)
+    return json.dumps({"type": "opportunity", "data": asdict(opportunity)}, default=str).encode("utf-8")
+
+
+async def stream_reader(client: PolymarketClient, event_queue: asyncio.Queue) -> None:
+    """Drain the WebSocket into the event queue, keeping the socket reading.
+
+    On overflow the oldest queued event is dropped in favor of the new one,
+    so a compute stall never back-pressures the network read.
+    """
+
+    async for event in client.stream():
+        try:
+            event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            try:
+                event_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            event_queue.put_nowait(event)
+
+
+async def consume_stream(
+    event_queue: asyncio.Queue,
+    detector: MarketArbitrageDetector,
+    state: InMemoryState,
+    audit_queue: Optional[asyncio.Queue] = None,
+) -> None:
+    logger = logging.getLogger("app.consume")
+    last_log_ts = 0.0
+    suppressed = 0
+    while True:
+        # Block for the first event, then drain whatever else is queued so a
+        # burst is processed in one tight loop instead of one scheduling
+        # round trip per message.
+        batch = [await event_queue.get()]
+        while len(batch) < EVENT_BATCH_SIZE:
+            try:
+                batch.append(event_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        for message in batch:
+            opportunity = detector.ingest(message)
+            if not opportunity:
+                continue
+            trade = {
+                "market_id": opportunity.market_id,
+                "direction": opportunity.direction,
+                "edge": opportunity.edge,
+                "notional": opportunity.notional,
+                "max_size": opportunity.max_size,
+                "details": opportunity.details,
+                "ts": asyncio.get_event_loop().time(),
+            }
+            state.add_trade(trade)
+            if audit_queue is not None:
+                try:
+                    audit_queue.put_nowait(_encode_audit(opportunity))
+                except asyncio.QueueFull:
+                    # Drop the audit record rather than stall the stream loop.
+                    pass
+
+            # Throttle logging so a burst of opportunities does not spend the
+            # loop formatting log lines; suppressed events are counted.
+            now = time.monotonic()
+            if now - last_log_ts > OPPORTUNITY_LOG_INTERVAL_SECONDS:
+                logger.info(
+                    "Opportunity %s %s edge=%.4f (suppressed=%d)",
+                    opportunity.market_id,
+                    opportunity.direction,
+                    opportunity.edge,
+                    suppressed,
+                )
+                last_log_ts = now
+                suppressed = 0
+            else:
+                suppressed += 1
+
+
+async def audit_writer(store: JsonlStore, audit_queue: asyncio.Queue, batch_size: int = AUDIT_BATCH_SIZE) -> None:
+    """Drain audit records in batches so disk I/O stays off the stream loop."""
+
+    while True:
+        batch = [await audit_queue.get()]
+        while len(batch) < batch_size:
+            try:
+                batch.append(audit_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        await asyncio.to_thread(store.append_lines, "trades", batch)
 
 
 async def main() -> None:
-    logging_setup.configure_logging()
+    configure_logging()
     logger = logging.getLogger("app")
 
     config = load_from_env()
@@ -51,9 +144,15 @@ async def main() -> None:
 
     client = PolymarketClient(order_book_markets=None, trade_markets=None, subscribe_metadata=False)
     detector = MarketArbitrageDetector(min_edge_bps=config.min_edge_bps)
+    audit = JsonlStore()
+    audit_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+    event_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
 
-    runner = consume_stream(client, detector, state)
-    tasks = [asyncio.create_task(runner)]
+    tasks = [
+        asyncio.create_task(stream_reader(client, event_queue)),
+        asyncio.create_task(consume_stream(event_queue, detector, state, audit_queue)),
+        asyncio.create_task(audit_writer(audit, audit_queue)),
+    ]
 
     if config.dashboard.enable:
         tasks.append(asyncio.create_task(run_dashboard(config, state)))
@@ -72,6 +171,8 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
 
 
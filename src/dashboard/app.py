@@ -1,17 +1,130 @@
-"""FastAPI dashboard to view opportunities and recent actions."""
+"""FastAPI dashboards for opportunities, trades, allocations, and dry-runs."""
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from collections import deque
 from dataclasses import asdict
-from typing import List
+from itertools import islice
+from typing import Any, Deque, Dict, List
+
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 
-from fastapi import FastAPI
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
+from src.infra.config import AppConfig
 from src.pricing.market_arbitrage import CompleteSetOpportunity
 
 
-def create_dashboard_app(state: "DashboardState") -> FastAPI:
-    app = FastAPI(title="Polymarket Arb Dashboard", version="0.1.0")
+if orjson is not None:
+
+    class _DataclassORJSONResponse(ORJSONResponse):
+        """ORJSONResponse that serializes dataclasses without an asdict pass."""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_SERIALIZE_DATACLASS)
+
+    _RESPONSE_CLASS = _DataclassORJSONResponse
+else:  # pragma: no cover - stdlib fallback
+    _RESPONSE_CLASS = JSONResponse
+
+
+#: How long a rendered home page stays fresh before re-rendering.
+_HOME_TTL_SECONDS = 0.5
+
+
+def _tail(items: Deque, count: int) -> List:
+    """Return the most recent ``count`` entries without copying the deque."""
+
+    start = max(len(items) - count, 0)
+    return list(islice(items, start, None))
+
+
+class DashboardState:
+    """Holds recent opportunities and actions for the arbitrage dashboard."""
+
+    def __init__(self) -> None:
+        # Each entry is (opportunity, cached asdict payload) so HTTP requests
+        # and push delivery reuse one conversion done at insertion time.
+        self.opportunities: Deque[tuple[CompleteSetOpportunity, dict]] = deque(maxlen=500)
+        self.actions: Deque[dict] = deque(maxlen=500)
+        self.subscribers: List[asyncio.Queue] = []
+        # Monotonic insert counter; the deques are bounded, so their lengths
+        # stop changing once full and cannot key cache validators.
+        self.version = 0
+
+    def subscribe(self, maxsize: int = 1000) -> asyncio.Queue:
+        """Register a bounded per-client queue for live push delivery."""
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        try:
+            self.subscribers.remove(queue)
+        except ValueError:
+            pass
+
+    def record_opportunity(self, opp: CompleteSetOpportunity) -> None:
+        payload = asdict(opp)
+        self.opportunities.append((opp, payload))
+        self.version += 1
+        self._publish(payload)
+
+    def record_action(self, action: dict) -> None:
+        self.actions.append(action)
+        self.version += 1
+        self._publish(action)
+
+    def _publish(self, message: dict) -> None:
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Drop for slow clients; ingest must never block on delivery.
+                continue
+
+
+def _render_home(state: DashboardState) -> str:
+    rows = "".join(
+        f"<tr><td>{payload['market_id']}</td><td>{payload['direction']}</td>"
+        f"<td>{payload['edge']:.4f}</td><td>{payload['max_size']}</td></tr>"
+        for _, payload in _tail(state.opportunities, 50)
+    )
+    actions = "".join(f"<li>{json.dumps(action, default=str)}</li>" for action in _tail(state.actions, 50))
+    return (
+        "<html><head><title>Polymarket Arb Dashboard</title></head><body>"
+        "<h1>Opportunities</h1>"
+        f"<table><tr><th>market</th><th>direction</th><th>edge</th><th>max size</th></tr>{rows}</table>"
+        f"<h1>Recent actions</h1><ul>{actions}</ul>"
+        "</body></html>"
+    )
+
+
+def create_dashboard_app(state: DashboardState) -> FastAPI:
+    app = FastAPI(title="Polymarket Arb Dashboard", version="0.1.0", default_response_class=_RESPONSE_CLASS)
+    home_cache = {"etag": "", "body": "", "rendered_at": 0.0}
+
+    @app.get("/")
+    async def home(request: Request) -> Response:
+        etag = f'"{state.version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        now = time.monotonic()
+        if home_cache["etag"] != etag or now - home_cache["rendered_at"] >= _HOME_TTL_SECONDS:
+            home_cache["etag"] = etag
+            home_cache["body"] = _render_home(state)
+            home_cache["rendered_at"] = now
+        return HTMLResponse(home_cache["body"], headers={"ETag": etag})
 
     @app.get("/health")
     async def health() -> dict:
@@ -19,50 +132,59 @@ def create_dashboard_app(state: "DashboardState") -> FastAPI:
 
     @app.get("/opportunities")
     async def opportunities() -> List[dict]:
-        return [asdict(opp) for opp in state.opportunities[-50:]]
+        return [payload for _, payload in _tail(state.opportunities, 50)]
 
     @app.get("/actions")
     async def actions() -> List[dict]:
-        return state.actions[-100:]
-"""Minimal FastAPI dashboard for monitoring trades, allocations, and dry-runs."""
-
+        return _tail(state.actions, 100)
+
+    @app.websocket("/ws")
+    async def stream(websocket: WebSocket) -> None:
+        await websocket.accept()
+        queue = state.subscribe()
+        try:
+            while True:
+                # Block for the first message, then drain whatever else is
+                # queued so one send covers the whole burst.
+                batch = [await queue.get()]
+                while True:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                await websocket.send_text(json.dumps(batch, default=str))
+        except WebSocketDisconnect:
+            pass
+        finally:
+            state.unsubscribe(queue)
 
-import asyncio
-from dataclasses import asdict
-from typing import Any, Dict, List
-
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-
-from src.infra.config import AppConfig
+    return app
 
 
 class InMemoryState:
     """Holds recent trades, allocations, and health info for the dashboard."""
 
     def __init__(self) -> None:
-        self.trades: List[Dict[str, Any]] = []
+        self.trades: Deque[Dict[str, Any]] = deque(maxlen=200)
         self.allocations: Dict[str, float] = {}  # market_id -> allocation percent
         self.health: Dict[str, Any] = {"status": "initializing"}
 
     def add_trade(self, trade: Dict[str, Any]) -> None:
         self.trades.append(trade)
-        if len(self.trades) > 200:
-            self.trades = self.trades[-200:]
 
     def set_allocation(self, market_id: str, allocation: float) -> None:
         self.allocations[market_id] = allocation
 
     def snapshot(self) -> Dict[str, Any]:
         return {
-            "trades": self.trades,
+            "trades": list(self.trades),
             "allocations": self.allocations,
             "health": self.health,
         }
 
 
 def create_app(config: AppConfig, state: InMemoryState) -> FastAPI:
-    app = FastAPI(title="Polymarket Bot Dashboard", version="0.1")
+    app = FastAPI(title="Polymarket Bot Dashboard", version="0.1", default_response_class=_RESPONSE_CLASS)
 
     @app.get("/health")
     async def health() -> Dict[str, Any]:
@@ -70,7 +192,7 @@ def create_app(config: AppConfig, state: InMemoryState) -> FastAPI:
 
     @app.get("/trades")
     async def trades() -> Dict[str, Any]:
-        return {"trades": state.trades}
+        return {"trades": list(state.trades)}
 
     @app.get("/allocations")
     async def allocations() -> Dict[str, Any]:
@@ -89,19 +211,6 @@ def create_app(config: AppConfig, state: InMemoryState) -> FastAPI:
     return app
 
 
-class DashboardState:
-    def __init__(self) -> None:
-        self.opportunities: List[CompleteSetOpportunity] = []
-        self.actions: List[dict] = []
-
-    def record_opportunity(self, opp: CompleteSetOpportunity) -> None:
-        self.opportunities.append(opp)
-
-    def record_action(self, action: dict) -> None:
-        self.actions.append(action)
-
-
-__all__ = ["create_dashboard_app", "DashboardState"]
 async def run_dashboard(config: AppConfig, state: InMemoryState) -> None:
     """Launch the dashboard if enabled."""
 
@@ -116,4 +225,10 @@ async def run_dashboard(config: AppConfig, state: InMemoryState) -> None:
     await server.serve()
 
 
-__all__ = ["create_app", "run_dashboard", "InMemoryState"]
+__all__ = [
+    "DashboardState",
+    "InMemoryState",
+    "create_dashboard_app",
+    "create_app",
+    "run_dashboard",
+]
@@ -3,7 +3,7 @@
 from .clients import VenueEndpoint, MarketDataClient
 from .hedge_client import HedgeClient, NormalizedOrderBook
 from .polling import PollingClient
-from .websocket import WebSocketSubscription
+from .websocket import WebSocketSubscription, tune_stream_socket
 
 __all__ = [
     "VenueEndpoint",
@@ -12,4 +12,5 @@ __all__ = [
     "NormalizedOrderBook",
     "PollingClient",
     "WebSocketSubscription",
+    "tune_stream_socket",
 ]
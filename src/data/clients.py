@@ -24,11 +24,11 @@ class MarketDataClient(Protocol):
 
     endpoint: VenueEndpoint
 
-    def fetch_order_book(self, symbol: str) -> Dict[str, Any]:
+    async def fetch_order_book(self, symbol: str) -> Dict[str, Any]:
         """Return the current order book snapshot for a symbol."""
 
-    def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
         """Return the latest ticker data for a symbol."""
 
-    def list_symbols(self) -> Iterable[str]:
+    async def list_symbols(self) -> Iterable[str]:
         """Return all supported trading symbols for the venue."""
@@ -8,41 +8,142 @@ retrieval and idempotent order placement using client-generated order IDs.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
-import uuid
-from dataclasses import asdict, dataclass, field
+import secrets
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
 
 import requests
 import websockets
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
 from .clients import MarketDataClient, VenueEndpoint
+from .websocket import tune_stream_socket
+
+
+#: Fixed-point scale for quantized prices (price units of 1e-6).
+PRICE_SCALE = 1_000_000
+
+#: Key spellings probed when extracting fields from venue payloads. A venue
+#: uses one spelling consistently, so the winning key is memoized per client.
+_MIN_SIZE_KEYS = ("min_size", "minSize", "min_order_size", "minOrderSize", "minimum_size")
+_TIMESTAMP_KEYS = ("timestamp", "ts", "time")
+
+#: Channel names that carry level-2 book data on the hedge feed.
+_BOOK_CHANNELS = frozenset(("book", "orderbook", "l2"))
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_cached(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp, caching repeats within high-frequency bursts."""
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+
+def _empty_levels() -> Any:
+    if np is not None:
+        return np.empty(0, dtype=np.float64)
+    return []
+
+
+def _empty_levels_q() -> Any:
+    if np is not None:
+        return np.empty(0, dtype=np.int64)
+    return []
+
+
+def _quantize_prices(prices: Any) -> Any:
+    """Quantize float prices to int64 fixed-point at PRICE_SCALE."""
+
+    if np is not None and isinstance(prices, np.ndarray):
+        return np.round(prices * PRICE_SCALE).astype(np.int64)
+    return [int(round(price * PRICE_SCALE)) for price in prices]
+
+
+def _levels_to_dicts(prices: Any, sizes: Any) -> List[Dict[str, float]]:
+    if np is not None and isinstance(prices, np.ndarray):
+        prices = prices.tolist()
+        sizes = sizes.tolist()
+    return [{"price": price, "size": size} for price, size in zip(prices, sizes)]
 
 
 @dataclass
 class NormalizedOrderBook:
-    """Unified order book representation for Hedge snapshots and updates."""
+    """Unified order book representation for Hedge snapshots and updates.
+
+    Levels are stored structure-of-arrays style (parallel price/size
+    vectors) so downstream pricing math can run vectorized over a single
+    contiguous buffer instead of a dict allocation per level. Prices are
+    additionally carried as int64 fixed-point (price * PRICE_SCALE) so
+    edge comparisons can be exact instead of epsilon-tolerant. The
+    list-of-dict shape is rebuilt only at the JSON boundary.
+    """
 
     symbol: str
-    bids: List[Dict[str, float]]
-    asks: List[Dict[str, float]]
-    maker_rate_bps: Optional[float]
-    taker_rate_bps: Optional[float]
-    min_size: Optional[float]
-    sequence: Optional[int]
-    timestamp: Optional[datetime]
-    type: str
+    bids_price: Any = field(default_factory=_empty_levels)
+    bids_size: Any = field(default_factory=_empty_levels)
+    asks_price: Any = field(default_factory=_empty_levels)
+    asks_size: Any = field(default_factory=_empty_levels)
+    bids_price_q: Any = field(default_factory=_empty_levels_q)
+    asks_price_q: Any = field(default_factory=_empty_levels_q)
+    maker_rate_bps: Optional[float] = None
+    taker_rate_bps: Optional[float] = None
+    min_size: Optional[float] = None
+    sequence: Optional[int] = None
+    timestamp: Optional[datetime] = None
+    type: str = "snapshot"
     raw: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def bids(self) -> List[Dict[str, float]]:
+        """Bid levels in the legacy list-of-dict shape."""
+
+        return _levels_to_dicts(self.bids_price, self.bids_size)
+
+    @property
+    def asks(self) -> List[Dict[str, float]]:
+        """Ask levels in the legacy list-of-dict shape."""
+
+        return _levels_to_dicts(self.asks_price, self.asks_size)
+
     def to_dict(self) -> Dict[str, Any]:
         """Return a JSON-serializable representation of the normalized book."""
 
-        payload = asdict(self)
-        if self.timestamp:
-            payload["timestamp"] = self.timestamp.isoformat()
-        return payload
+        return {
+            "symbol": self.symbol,
+            "bids": self.bids,
+            "asks": self.asks,
+            "maker_rate_bps": self.maker_rate_bps,
+            "taker_rate_bps": self.taker_rate_bps,
+            "min_size": self.min_size,
+            "sequence": self.sequence,
+            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "type": self.type,
+            "raw": self.raw,
+        }
 
 
 class HedgeClient(MarketDataClient):
@@ -63,25 +164,68 @@ class HedgeClient(MarketDataClient):
         self.api_key = api_key
         self.session = session or requests.Session()
         self.logger = logger or logging.getLogger(__name__)
+        self._async_session = self._build_async_session()
+        self._min_size_key: Optional[str] = None
+        self._timestamp_key: Optional[str] = None
+        # Process-unique prefix plus a monotonic counter gives collision-free
+        # client order IDs without per-order urandom draws.
+        self._oid_prefix = secrets.token_hex(4)
+        self._oid_counter = itertools.count()
+
+    def _build_async_session(self) -> Optional["httpx.AsyncClient"]:
+        if httpx is None:
+            return None
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        try:
+            return httpx.AsyncClient(http2=True, base_url=self.endpoint.rest_url, timeout=10, limits=limits)
+        except ImportError:  # pragma: no cover - h2 extra not installed
+            return httpx.AsyncClient(base_url=self.endpoint.rest_url, timeout=10, limits=limits)
+
+    async def aclose(self) -> None:
+        """Release pooled async connections."""
+
+        if self._async_session is not None:
+            await self._async_session.aclose()
 
     # --- Market data: REST -------------------------------------------------
-    def fetch_order_book(self, symbol: str) -> Dict[str, Any]:
+    async def fetch_order_book(self, symbol: str) -> Dict[str, Any]:
         """Fetch a level 2 order book snapshot via REST and normalize it."""
 
         path = f"/markets/{symbol}/orderbook"
-        payload = self._rest_get(path)
+        payload = await self._arest_get(path)
         book = self._normalize_book(payload or {}, kind="snapshot", symbol=symbol)
         return book.to_dict() if book else {}
 
-    def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
         """Return Hedge ticker information for a symbol."""
 
         path = f"/markets/{symbol}/ticker"
-        return self._rest_get(path) or {}
+        return await self._arest_get(path) or {}
 
-    def list_symbols(self) -> Iterable[str]:
+    async def list_symbols(self) -> Iterable[str]:
         """Return all tradable symbols available on Hedge."""
 
+        payload = await self._arest_get("/markets") or {}
+        markets: Sequence[Dict[str, Any]] = payload if isinstance(payload, list) else payload.get("markets", [])
+        return [str(mkt.get("symbol")) for mkt in markets if mkt.get("symbol")]
+
+    def fetch_order_book_sync(self, symbol: str) -> Dict[str, Any]:
+        """Synchronous snapshot fetch retained for the polling path."""
+
+        path = f"/markets/{symbol}/orderbook"
+        payload = self._rest_get(path)
+        book = self._normalize_book(payload or {}, kind="snapshot", symbol=symbol)
+        return book.to_dict() if book else {}
+
+    def fetch_ticker_sync(self, symbol: str) -> Dict[str, Any]:
+        """Synchronous ticker fetch retained for the polling path."""
+
+        path = f"/markets/{symbol}/ticker"
+        return self._rest_get(path) or {}
+
+    def list_symbols_sync(self) -> Iterable[str]:
+        """Synchronous symbol listing retained for the polling path."""
+
         payload = self._rest_get("/markets") or {}
         markets: Sequence[Dict[str, Any]] = payload if isinstance(payload, list) else payload.get("markets", [])
         return [str(mkt.get("symbol")) for mkt in markets if mkt.get("symbol")]
@@ -90,15 +234,25 @@ class HedgeClient(MarketDataClient):
     async def stream_order_books(self, symbols: Iterable[str]) -> AsyncIterator[NormalizedOrderBook]:
         """Yield normalized incremental updates for the provided symbols."""
 
-        async with websockets.connect(self.endpoint.websocket_url, extra_headers=self._ws_headers()) as ws:
+        async with websockets.connect(
+            self.endpoint.websocket_url,
+            additional_headers=self._ws_headers(),
+            compression=None,
+            max_queue=16384,
+            max_size=4 * 1024 * 1024,
+        ) as ws:
+            tune_stream_socket(ws, logger=self.logger)
             for symbol in symbols:
                 await ws.send(json.dumps({"type": "subscribe", "channel": "book", "symbol": symbol}))
 
+            # Bind hot names locally; global/attribute lookups cost on every frame.
+            loads = _loads
+            book_channels = _BOOK_CHANNELS
             async for raw in ws:
-                message = json.loads(raw)
+                message = loads(raw)
                 data = message.get("data") or message
                 channel = message.get("channel") or data.get("channel") or message.get("type")
-                if channel not in {"book", "orderbook", "l2"}:
+                if channel not in book_channels:
                     continue
 
                 kind = "snapshot" if self._is_snapshot(data) else "incremental"
@@ -107,12 +261,12 @@ class HedgeClient(MarketDataClient):
                     yield normalized
 
     # --- Accounts ---------------------------------------------------------
-    def fetch_balances(self) -> Dict[str, Any]:
+    async def fetch_balances(self) -> Dict[str, Any]:
         """Retrieve account balances."""
 
-        return self._rest_get("/account/balances") or {}
+        return await self._arest_get("/account/balances") or {}
 
-    def place_order(
+    async def place_order(
         self,
         symbol: str,
         side: str,
@@ -142,7 +296,7 @@ class HedgeClient(MarketDataClient):
         if min_size and size < min_size:
             raise ValueError(f"Order size {size} below min size {min_size} for {symbol}")
 
-        return self._rest_post("/orders", json=payload) or {}
+        return await self._arest_post("/orders", json=payload) or {}
 
     # --- Normalization helpers -------------------------------------------
     def _normalize_book(self, payload: Dict[str, Any], kind: str, symbol: Optional[str] = None) -> Optional[NormalizedOrderBook]:
@@ -164,16 +318,20 @@ class HedgeClient(MarketDataClient):
             or payload.get("takerFee")
         )
 
-        bids = self._normalize_levels(payload.get("bids") or payload.get("bid") or payload.get("buy"), min_size)
-        asks = self._normalize_levels(payload.get("asks") or payload.get("ask") or payload.get("sell"), min_size)
+        bids_price, bids_size = self._normalize_levels(payload.get("bids") or payload.get("bid") or payload.get("buy"), min_size)
+        asks_price, asks_size = self._normalize_levels(payload.get("asks") or payload.get("ask") or payload.get("sell"), min_size)
 
         sequence = self._safe_int(payload.get("sequence") or payload.get("seq") or payload.get("version"))
-        timestamp = self._parse_timestamp(payload.get("timestamp") or payload.get("ts") or payload.get("time"))
+        timestamp = self._parse_timestamp(self._timestamp_value(payload))
 
         return NormalizedOrderBook(
             symbol=book_symbol,
-            bids=bids,
-            asks=asks,
+            bids_price=bids_price,
+            bids_size=bids_size,
+            asks_price=asks_price,
+            asks_size=asks_size,
+            bids_price_q=_quantize_prices(bids_price),
+            asks_price_q=_quantize_prices(asks_price),
             maker_rate_bps=maker_rate,
             taker_rate_bps=taker_rate,
             min_size=min_size,
@@ -183,20 +341,52 @@ class HedgeClient(MarketDataClient):
             raw=payload,
         )
 
-    def _normalize_levels(self, side: Any, min_size: Optional[float]) -> List[Dict[str, float]]:
-        normalized: List[Dict[str, float]] = []
-        if not side:
-            return normalized
-
-        levels: Sequence[Any] = side if isinstance(side, Sequence) else []
-        for level in levels:
-            price, size = self._parse_level(level)
-            if price is None or size is None:
-                continue
-            if min_size is not None and size < min_size:
-                continue
-            normalized.append({"price": price, "size": size})
-        return normalized
+    def _normalize_levels(self, side: Any, min_size: Optional[float]) -> tuple[Any, Any]:
+        """Return parallel (prices, sizes) vectors for one book side."""
+
+        prices: List[float] = []
+        sizes: List[float] = []
+        if side:
+            levels: Sequence[Any] = side if isinstance(side, Sequence) else []
+            fast = self._normalize_levels_array(levels, min_size)
+            if fast is not None:
+                return fast
+
+            for level in levels:
+                price, size = self._parse_level(level)
+                if price is None or size is None:
+                    continue
+                if min_size is not None and size < min_size:
+                    continue
+                prices.append(price)
+                sizes.append(size)
+
+        if np is not None:
+            return np.asarray(prices, dtype=np.float64), np.asarray(sizes, dtype=np.float64)
+        return prices, sizes
+
+    def _normalize_levels_array(self, levels: Sequence[Any], min_size: Optional[float]) -> Optional[tuple[Any, Any]]:
+        """Vectorized fast path for the common ``[[price, size], ...]`` payload.
+
+        Returns None when the payload shape does not match, so the caller
+        falls back to the per-level parser.
+        """
+
+        if np is None or not levels:
+            return None
+        if not all(isinstance(level, (list, tuple)) and len(level) >= 2 for level in levels):
+            return None
+        try:
+            arr = np.asarray([[level[0], level[1]] for level in levels], dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+
+        prices = arr[:, 0]
+        sizes = arr[:, 1]
+        mask = ~(np.isnan(prices) | np.isnan(sizes))
+        if min_size is not None:
+            mask &= sizes >= min_size
+        return prices[mask], sizes[mask]
 
     def _parse_level(self, level: Any) -> tuple[Optional[float], Optional[float]]:
         if isinstance(level, (list, tuple)) and len(level) >= 2:
@@ -207,12 +397,31 @@ class HedgeClient(MarketDataClient):
             )
         return None, None
 
+    def _timestamp_value(self, payload: Dict[str, Any]) -> Any:
+        """Return the raw timestamp value, remembering which key the venue uses."""
+
+        if self._timestamp_key is not None:
+            value = payload.get(self._timestamp_key)
+            if value is not None:
+                return value
+        for key in _TIMESTAMP_KEYS:
+            value = payload.get(key)
+            if value is not None:
+                self._timestamp_key = key
+                return value
+        return None
+
     def _extract_min_size(self, payload: Dict[str, Any]) -> Optional[float]:
         if not payload:
             return None
 
-        for key in ("min_size", "minSize", "min_order_size", "minOrderSize", "minimum_size"):
+        if self._min_size_key is not None:
+            cached = self._safe_float(payload.get(self._min_size_key))
+            if cached is not None:
+                return cached
+        for key in _MIN_SIZE_KEYS:
             if key in payload:
+                self._min_size_key = key
                 return self._safe_float(payload.get(key))
 
         filters = payload.get("filters") or payload.get("symbol_filters")
@@ -243,18 +452,12 @@ class HedgeClient(MarketDataClient):
             timestamp = value / 1000.0 if value > 1e12 else value
             return datetime.fromtimestamp(timestamp, tz=timezone.utc)
         if isinstance(value, str):
-            for parser in (self._parse_iso, self._parse_numeric_str):
+            for parser in (_parse_iso_cached, self._parse_numeric_str):
                 parsed = parser(value)
                 if parsed:
                     return parsed
         return None
 
-    def _parse_iso(self, value: str) -> Optional[datetime]:
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
-        except ValueError:
-            return None
-
     def _parse_numeric_str(self, value: str) -> Optional[datetime]:
         try:
             numeric = float(value)
@@ -283,6 +486,28 @@ class HedgeClient(MarketDataClient):
         return message_type in {"snapshot", "book_snapshot", "l2_snapshot"}
 
     # --- REST helpers -----------------------------------------------------
+    async def _arest_get(self, path: str) -> Optional[Dict[str, Any]]:
+        if self._async_session is None:
+            return await asyncio.to_thread(self._rest_get, path)
+        try:
+            response = await self._async_session.get(path, headers=self._headers())
+            response.raise_for_status()
+            return response.json()
+        except Exception as exc:  # pragma: no cover - network dependent
+            self.logger.warning("GET %s failed: %s", path, exc)
+        return None
+
+    async def _arest_post(self, path: str, json: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self._async_session is None:
+            return await asyncio.to_thread(self._rest_post, path, json)
+        try:
+            response = await self._async_session.post(path, headers=self._headers(), json=json)
+            response.raise_for_status()
+            return response.json()
+        except Exception as exc:  # pragma: no cover - network dependent
+            self.logger.warning("POST %s failed: %s", path, exc)
+        return None
+
     def _rest_get(self, path: str) -> Optional[Dict[str, Any]]:
         url = f"{self.endpoint.rest_url}{path}"
         try:
@@ -316,7 +541,7 @@ class HedgeClient(MarketDataClient):
         return headers
 
     def _client_order_id(self) -> str:
-        return uuid.uuid4().hex
+        return f"{self._oid_prefix}{next(self._oid_counter):012x}"
 
 
 __all__ = ["HedgeClient", "NormalizedOrderBook"]
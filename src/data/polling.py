@@ -1,8 +1,11 @@
 """Polling utilities for periodic REST-based market data collection."""
 
-from dataclasses import dataclass
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Callable, Iterable, List
+from typing import Awaitable, Callable, Iterable, List, Optional
 
 from .clients import MarketDataClient
 
@@ -13,28 +16,48 @@ class PollingTask:
 
     symbol: str
     interval: timedelta
-    handler: Callable[[str], None]
+    handler: Callable[[str], Awaitable[None]]
+    last_run: float = field(default=0.0)  # monotonic timestamp of the last dispatch
 
 
 class PollingClient:
     """Simple polling coordinator for market data snapshots."""
 
-    def __init__(self, client: MarketDataClient):
+    def __init__(self, client: MarketDataClient, logger: Optional[logging.Logger] = None):
         self._client = client
         self._tasks: List[PollingTask] = []
+        self.logger = logger or logging.getLogger(__name__)
 
     def add_task(self, task: PollingTask) -> None:
         """Register a new polling task."""
 
         self._tasks.append(task)
 
-    def run_once(self) -> None:
-        """Execute a single polling pass across all tasks."""
-
-        for task in self._tasks:
-            task.handler(task.symbol)
-
-    def symbols(self) -> Iterable[str]:
+    async def run_once(self) -> None:
+        """Execute a single polling pass, fanning due tasks out concurrently.
+
+        Tasks whose interval has not yet elapsed since their last dispatch
+        are skipped, so callers can drive this on a tight loop without
+        over-polling individual symbols.
+        """
+
+        now = time.monotonic()
+        due = [task for task in self._tasks if not task.last_run or now - task.last_run >= task.interval.total_seconds()]
+        if not due:
+            return
+        for task in due:
+            task.last_run = now
+        # return_exceptions keeps one failing handler from cancelling the
+        # rest of the fan-out; failures are logged rather than swallowed.
+        results = await asyncio.gather(*(task.handler(task.symbol) for task in due), return_exceptions=True)
+        for task, result in zip(due, results):
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    "Polling handler failed for %s: %s", task.symbol, result,
+                    extra={"event": "polling_handler_failed", "symbol": task.symbol},
+                )
+
+    async def symbols(self) -> Iterable[str]:
         """Expose symbols supported by the underlying client."""
 
-        return self._client.list_symbols()
+        return await self._client.list_symbols()
@@ -15,15 +15,90 @@ import random
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+from functools import lru_cache
+from collections import defaultdict, deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 import requests
 import websockets
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    _loads = json.loads
+    _dumps = json.dumps
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from src.data.websocket import tune_stream_socket
 from src.infra.metrics import MetricsSink
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_iso_cached(value: str) -> Optional[float]:
+    """Parse an ISO-8601 timestamp to epoch seconds, memoizing repeats.
+
+    Feeds frequently stamp bursts of ticks with the same timestamp, so the
+    cache turns the fromisoformat work into a dict lookup.
+    """
+
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _safe_float(value: Any) -> Optional[float]:
+    try:
+        if value is None:
+            return None
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _safe_int(value: Any) -> Optional[int]:
+    try:
+        if value is None:
+            return None
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_numeric_string_cached(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+#: Flush aggregated latency metrics after this many buffered timestamps.
+LATENCY_BATCH_SIZE = 256
+#: ...or after this much wall time, whichever comes first.
+LATENCY_FLUSH_SECONDS = 0.01
+#: Flush buffered metric emissions after this many samples or this interval.
+METRICS_BUFFER_LIMIT = 1000
+METRICS_FLUSH_SECONDS = 1.0
+
+
+@dataclass(slots=True)
 class BackoffConfig:
     """Configuration for reconnection backoff."""
 
@@ -33,9 +108,13 @@ class BackoffConfig:
     jitter: float = 0.25
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedMarketData:
-    """Normalized data shape used by downstream consumers."""
+    """Normalized data shape used by downstream consumers.
+
+    Slots keep the per-message footprint small; one of these is allocated
+    for every websocket frame.
+    """
 
     market_id: str
     outcome_id: Optional[str]
@@ -69,6 +148,7 @@ class PolymarketClient:
         order_book_markets: Optional[Iterable[str]] = None,
         trade_markets: Optional[Iterable[str]] = None,
         subscribe_metadata: bool = True,
+        keep_raw: bool = False,
         backoff: Optional[BackoffConfig] = None,
         metrics_callback: Optional[Callable[[str, Dict[str, float]], None]] = None,
         metrics: Optional[MetricsSink] = None,
@@ -80,13 +160,58 @@ class PolymarketClient:
         self.order_book_markets = set(order_book_markets or [])
         self.trade_markets = set(trade_markets or [])
         self.subscribe_metadata = subscribe_metadata
+        self.keep_raw = keep_raw
         self.backoff = backoff or BackoffConfig()
         self.metrics = metrics
         self.metrics_callback = metrics_callback or (self.metrics.observe if self.metrics else None)
         self.logger = logger or logging.getLogger(__name__)
 
-        self._sequence_tracker: Dict[str, int] = {}
+        # Pooled session so gap-recovery REST calls reuse TCP/TLS connections
+        # instead of paying a fresh handshake per request.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Async counterpart for callers already on the event loop; created
+        # lazily so sync-only usage never touches httpx.
+        self._async_client: Optional["httpx.AsyncClient"] = None
+
+        self._sequence_tracker: Dict[Tuple[str, str, Optional[str]], int] = {}
         self._running = False
+        self._latency_buffer: Deque[float] = deque()
+        self._latency_last_flush = time.monotonic()
+        # Metric emissions are buffered per name and flushed as one callback
+        # call each, so a high-rate feed does not pay a callback per event.
+        self._metrics_buffer: Dict[str, List[Dict[str, float]]] = defaultdict(list)
+        self._metrics_buffered = 0
+        self._metrics_last_flush = time.monotonic()
+        # Forensic ring buffer of recent raw frames; keeps debugging possible
+        # without every NormalizedMarketData pinning its parsed JSON tree.
+        self._raw_frames: Deque[Dict[str, Any]] = deque(maxlen=1024)
+        # Recovered snapshots land here and are yielded between frames, so
+        # REST recovery never blocks the websocket consumer.
+        self._pending_snapshots: Deque[NormalizedMarketData] = deque()
+        self._recovery_tasks: Set["asyncio.Task"] = set()
+        # Subscription frames are immutable for the life of the client, so
+        # serialize them once instead of per reconnect.
+        self._orderbook_frames: List[Tuple[str, str]] = [
+            (market_id, _dumps({"type": "subscribe", "channel": "orderbook", "market": market_id}))
+            for market_id in self.order_book_markets
+        ]
+        self._trade_frames: List[Tuple[str, str]] = [
+            (market_id, _dumps({"type": "subscribe", "channel": "trades", "market": market_id}))
+            for market_id in self.trade_markets
+        ]
+        self._metadata_frame = _dumps({"type": "subscribe", "channel": "markets"})
+        # One hash lookup per frame instead of a chain of comparisons.
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Optional[NormalizedMarketData]]] = {
+            "orderbook": self._normalize_order_book,
+            "trade": self._normalize_trade,
+            "trades": self._normalize_trade,
+            "market": self._normalize_metadata,
+            "markets": self._normalize_metadata,
+            "metadata": self._normalize_metadata,
+        }
 
     async def stream(self) -> AsyncIterator[NormalizedMarketData]:
         """Yield normalized market data events with reconnection and backoff."""
@@ -115,32 +240,40 @@ class PolymarketClient:
 
     async def _consume_once(self) -> AsyncIterator[NormalizedMarketData]:
         async with websockets.connect(self.websocket_url, ping_interval=20, ping_timeout=20) as ws:
+            tune_stream_socket(ws, logger=self.logger)
             await self._send_subscriptions(ws)
-            async for raw in ws:
-                message = json.loads(raw)
+            recv = ws.recv
+            while True:
+                try:
+                    # decode=False skips the UTF-8 str conversion; the JSON
+                    # parser consumes the raw bytes directly.
+                    raw = await recv(decode=False)
+                except websockets.exceptions.ConnectionClosedOK:
+                    break
+                message = _loads(raw)
                 normalized = self._normalize_message(message)
                 if normalized:
                     yield normalized
+                while self._pending_snapshots:
+                    yield self._pending_snapshots.popleft()
 
     async def _send_subscriptions(self, ws: websockets.WebSocketClientProtocol) -> None:
         """Send subscriptions for order books, trades, and metadata."""
 
-        for market_id in self.order_book_markets:
-            payload = {"type": "subscribe", "channel": "orderbook", "market": market_id}
-            await ws.send(json.dumps(payload))
+        for market_id, frame in self._orderbook_frames:
+            await ws.send(frame)
             self.logger.info(
                 "Subscribed to orderbook",
                 extra={"event": "subscription", "channel": "orderbook", "market_id": market_id},
             )
-        for market_id in self.trade_markets:
-            payload = {"type": "subscribe", "channel": "trades", "market": market_id}
-            await ws.send(json.dumps(payload))
+        for market_id, frame in self._trade_frames:
+            await ws.send(frame)
             self.logger.info(
                 "Subscribed to trades",
                 extra={"event": "subscription", "channel": "trades", "market_id": market_id},
             )
         if self.subscribe_metadata:
-            await ws.send(json.dumps({"type": "subscribe", "channel": "markets"}))
+            await ws.send(self._metadata_frame)
             self.logger.info(
                 "Subscribed to markets metadata",
                 extra={"event": "subscription", "channel": "markets"},
@@ -148,34 +281,32 @@ class PolymarketClient:
 
     def _normalize_message(self, message: Dict[str, Any]) -> Optional[NormalizedMarketData]:
         event_type = message.get("type") or message.get("channel")
+        handler = self._dispatch.get(event_type)
+        if handler is None:
+            return None
         data = message.get("data") or message
-
-        if event_type == "orderbook":
-            return self._normalize_order_book(data)
-        if event_type == "trade" or event_type == "trades":
-            return self._normalize_trade(data)
-        if event_type in {"market", "markets", "metadata"}:
-            return self._normalize_metadata(data)
-        return None
+        self._raw_frames.append(data)
+        return handler(data)
 
     def _normalize_order_book(self, data: Dict[str, Any]) -> Optional[NormalizedMarketData]:
-        market_id = str(data.get("market") or data.get("market_id") or "")
-        outcome_id = str(data.get("outcome") or data.get("outcome_id") or "") or None
+        # Hoisted locals keep this single pass over the dict free of repeated
+        # attribute and global lookups; it runs for every orderbook frame.
+        g = data.get
+        market_id = str(g("market") or g("market_id") or "")
+        outcome_id = str(g("outcome") or g("outcome_id") or "") or None
         if not market_id:
             return None
-        bid = self._safe_float(data.get("bid"))
-        ask = self._safe_float(data.get("ask"))
-        size = self._safe_float(data.get("size") or data.get("quantity"))
-        fee_bps = self._safe_int(data.get("fee_bps") or data.get("feeBps"))
-        liquidity = self._safe_float(data.get("liquidity"))
-        sequence = self._safe_int(data.get("sequence") or data.get("seq"))
+        f, i = _safe_float, _safe_int
+        bid = f(g("bid"))
+        ask = f(g("ask"))
+        size = f(g("size") or g("quantity"))
+        fee_bps = i(g("fee_bps") or g("feeBps"))
+        liquidity = f(g("liquidity"))
+        sequence = i(g("sequence") or g("seq"))
         latency_ms, lag_seconds = self._timing_metrics(data)
 
-        gap_detected = self._detect_sequence_gap("orderbook", market_id, outcome_id, sequence)
-        if gap_detected:
-            fallback = self.fetch_order_book_snapshot(market_id, outcome_id)
-            if fallback:
-                return fallback
+        if self._detect_sequence_gap("orderbook", market_id, outcome_id, sequence):
+            self._schedule_gap_recovery(self.fetch_order_book_snapshot, market_id, outcome_id)
 
         return NormalizedMarketData(
             market_id=market_id,
@@ -183,33 +314,32 @@ class PolymarketClient:
             bid=bid,
             ask=ask,
             size=size,
-            last_trade=self._safe_float(data.get("last_trade")),
+            last_trade=f(g("last_trade")),
             fee_bps=fee_bps,
             liquidity=liquidity,
             type="order_book",
             sequence=sequence,
             latency_ms=latency_ms,
             lag_seconds=lag_seconds,
-            raw=data,
+            raw=data if self.keep_raw else {},
         )
 
     def _normalize_trade(self, data: Dict[str, Any]) -> Optional[NormalizedMarketData]:
-        market_id = str(data.get("market") or data.get("market_id") or "")
-        outcome_id = str(data.get("outcome") or data.get("outcome_id") or "") or None
+        g = data.get
+        market_id = str(g("market") or g("market_id") or "")
+        outcome_id = str(g("outcome") or g("outcome_id") or "") or None
         if not market_id:
             return None
-        price = self._safe_float(data.get("price"))
-        size = self._safe_float(data.get("size") or data.get("quantity"))
-        fee_bps = self._safe_int(data.get("fee_bps") or data.get("feeBps"))
-        liquidity = self._safe_float(data.get("liquidity"))
-        sequence = self._safe_int(data.get("sequence") or data.get("seq"))
+        f, i = _safe_float, _safe_int
+        price = f(g("price"))
+        size = f(g("size") or g("quantity"))
+        fee_bps = i(g("fee_bps") or g("feeBps"))
+        liquidity = f(g("liquidity"))
+        sequence = i(g("sequence") or g("seq"))
         latency_ms, lag_seconds = self._timing_metrics(data)
 
-        gap_detected = self._detect_sequence_gap("trade", market_id, outcome_id, sequence)
-        if gap_detected:
-            fallback = self.fetch_trades_snapshot(market_id, outcome_id)
-            if fallback:
-                return fallback
+        if self._detect_sequence_gap("trade", market_id, outcome_id, sequence):
+            self._schedule_gap_recovery(self.fetch_trades_snapshot, market_id, outcome_id)
 
         return NormalizedMarketData(
             market_id=market_id,
@@ -224,16 +354,18 @@ class PolymarketClient:
             sequence=sequence,
             latency_ms=latency_ms,
             lag_seconds=lag_seconds,
-            raw=data,
+            raw=data if self.keep_raw else {},
         )
 
     def _normalize_metadata(self, data: Dict[str, Any]) -> Optional[NormalizedMarketData]:
-        market_id = str(data.get("id") or data.get("market") or data.get("market_id") or "")
+        g = data.get
+        market_id = str(g("id") or g("market") or g("market_id") or "")
         if not market_id:
             return None
-        fee_bps = self._safe_int(data.get("fee_bps") or data.get("feeBps"))
-        liquidity = self._safe_float(data.get("liquidity"))
-        sequence = self._safe_int(data.get("sequence") or data.get("seq"))
+        f, i = _safe_float, _safe_int
+        fee_bps = i(g("fee_bps") or g("feeBps"))
+        liquidity = f(g("liquidity"))
+        sequence = i(g("sequence") or g("seq"))
         latency_ms, lag_seconds = self._timing_metrics(data)
 
         return NormalizedMarketData(
@@ -242,14 +374,14 @@ class PolymarketClient:
             bid=None,
             ask=None,
             size=None,
-            last_trade=self._safe_float(data.get("last_trade")),
+            last_trade=f(g("last_trade")),
             fee_bps=fee_bps,
             liquidity=liquidity,
             type="metadata",
             sequence=sequence,
             latency_ms=latency_ms,
             lag_seconds=lag_seconds,
-            raw=data,
+            raw=data if self.keep_raw else {},
         )
 
     def fetch_order_book_snapshot(
@@ -257,8 +389,23 @@ class PolymarketClient:
     ) -> Optional[NormalizedMarketData]:
         """REST fallback for order book snapshots."""
 
-        path = f"/markets/{market_id}/orderbook"
-        response = self._rest_get(path)
+        response = self._rest_get(f"/markets/{market_id}/orderbook")
+        return self._order_book_snapshot_from(market_id, outcome_id, response)
+
+    async def fetch_order_book_snapshot_async(
+        self, market_id: str, outcome_id: Optional[str] = None
+    ) -> Optional[NormalizedMarketData]:
+        """Async REST fallback for order book snapshots; no thread handoff."""
+
+        response = await self._async_rest_get(f"/markets/{market_id}/orderbook")
+        return self._order_book_snapshot_from(market_id, outcome_id, response)
+
+    def _order_book_snapshot_from(
+        self,
+        market_id: str,
+        outcome_id: Optional[str],
+        response: Optional[Dict[str, Any]],
+    ) -> Optional[NormalizedMarketData]:
         if not response:
             return None
 
@@ -271,11 +418,11 @@ class PolymarketClient:
         else:
             outcome_payload = response.get("outcomes", [{}])[0]
 
-        bid = self._safe_float(outcome_payload.get("bid"))
-        ask = self._safe_float(outcome_payload.get("ask"))
-        size = self._safe_float(outcome_payload.get("size"))
-        fee_bps = self._safe_int(outcome_payload.get("fee_bps") or response.get("fee_bps"))
-        liquidity = self._safe_float(outcome_payload.get("liquidity") or response.get("liquidity"))
+        bid = _safe_float(outcome_payload.get("bid"))
+        ask = _safe_float(outcome_payload.get("ask"))
+        size = _safe_float(outcome_payload.get("size"))
+        fee_bps = _safe_int(outcome_payload.get("fee_bps") or response.get("fee_bps"))
+        liquidity = _safe_float(outcome_payload.get("liquidity") or response.get("liquidity"))
 
         snapshot = NormalizedMarketData(
             market_id=market_id,
@@ -283,7 +430,7 @@ class PolymarketClient:
             bid=bid,
             ask=ask,
             size=size,
-            last_trade=self._safe_float(outcome_payload.get("last_trade")),
+            last_trade=_safe_float(outcome_payload.get("last_trade")),
             fee_bps=fee_bps,
             liquidity=liquidity,
             type="order_book_snapshot",
@@ -310,8 +457,23 @@ class PolymarketClient:
     ) -> Optional[NormalizedMarketData]:
         """REST fallback for the most recent trade to backfill gaps."""
 
-        path = f"/markets/{market_id}/trades?limit={limit}"
-        response = self._rest_get(path)
+        response = self._rest_get(f"/markets/{market_id}/trades?limit={limit}")
+        return self._trade_snapshot_from(market_id, outcome_id, response)
+
+    async def fetch_trades_snapshot_async(
+        self, market_id: str, outcome_id: Optional[str] = None, limit: int = 1
+    ) -> Optional[NormalizedMarketData]:
+        """Async REST fallback for recent trades; no thread handoff."""
+
+        response = await self._async_rest_get(f"/markets/{market_id}/trades?limit={limit}")
+        return self._trade_snapshot_from(market_id, outcome_id, response)
+
+    def _trade_snapshot_from(
+        self,
+        market_id: str,
+        outcome_id: Optional[str],
+        response: Optional[Any],
+    ) -> Optional[NormalizedMarketData]:
         if not response:
             return None
         trades: List[Dict[str, Any]] = response if isinstance(response, list) else response.get("trades", [])
@@ -330,10 +492,10 @@ class PolymarketClient:
             outcome_id=outcome_id,
             bid=None,
             ask=None,
-            size=self._safe_float(trade.get("size") or trade.get("quantity")),
-            last_trade=self._safe_float(trade.get("price")),
-            fee_bps=self._safe_int(trade.get("fee_bps") or trade.get("feeBps")),
-            liquidity=self._safe_float(trade.get("liquidity")),
+            size=_safe_float(trade.get("size") or trade.get("quantity")),
+            last_trade=_safe_float(trade.get("price")),
+            fee_bps=_safe_int(trade.get("fee_bps") or trade.get("feeBps")),
+            liquidity=_safe_float(trade.get("liquidity")),
             type="trade_snapshot",
             raw=trade,
         )
@@ -366,9 +528,9 @@ class PolymarketClient:
             bid=None,
             ask=None,
             size=None,
-            last_trade=self._safe_float(response.get("last_trade")),
-            fee_bps=self._safe_int(response.get("fee_bps") or response.get("feeBps")),
-            liquidity=self._safe_float(response.get("liquidity")),
+            last_trade=_safe_float(response.get("last_trade")),
+            fee_bps=_safe_int(response.get("fee_bps") or response.get("feeBps")),
+            liquidity=_safe_float(response.get("liquidity")),
             type="metadata_snapshot",
             raw=response,
         )
@@ -377,19 +539,84 @@ class PolymarketClient:
         base_url = (base or self.rest_base_url).rstrip("/")
         url = f"{base_url}{path}"
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except Exception as exc:  # pragma: no cover - network dependent
             self.logger.warning("REST fallback failed for %s: %s", url, exc)
         return None
 
+    async def _async_rest_get(self, path: str, base: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """GET on the event loop via the pooled async client.
+
+        Falls back to the synchronous session in a worker thread when httpx
+        is not installed, keeping the loop unblocked either way.
+        """
+
+        if httpx is None:
+            return await asyncio.to_thread(self._rest_get, path, base)
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32),
+                timeout=10,
+            )
+        base_url = (base or self.rest_base_url).rstrip("/")
+        url = f"{base_url}{path}"
+        try:
+            response = await self._async_client.get(url)
+            response.raise_for_status()
+            return _loads(response.content)
+        except Exception as exc:  # pragma: no cover - network dependent
+            self.logger.warning("REST fallback failed for %s: %s", url, exc)
+        return None
+
+    def _schedule_gap_recovery(
+        self,
+        fetch: Callable[[str, Optional[str]], Optional[NormalizedMarketData]],
+        market_id: str,
+        outcome_id: Optional[str],
+    ) -> None:
+        """Run a REST snapshot fetch without blocking the websocket loop.
+
+        The blocking call is pushed to a worker thread; the recovered
+        snapshot is yielded from :meth:`_consume_once` as a follow-up
+        message. Without a running loop (sync callers, tests) the fetch
+        runs inline.
+        """
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            snapshot = fetch(market_id, outcome_id)
+            if snapshot:
+                self._pending_snapshots.append(snapshot)
+            return
+
+        task = loop.create_task(asyncio.to_thread(fetch, market_id, outcome_id))
+        self._recovery_tasks.add(task)
+
+        def _collect(done: "asyncio.Task") -> None:
+            self._recovery_tasks.discard(done)
+            if done.cancelled():
+                return
+            exc = done.exception()
+            if exc is not None:  # pragma: no cover - network dependent
+                self.logger.warning("Gap recovery failed for %s: %s", market_id, exc)
+                return
+            snapshot = done.result()
+            if snapshot:
+                self._pending_snapshots.append(snapshot)
+
+        task.add_done_callback(_collect)
+
     def _detect_sequence_gap(
         self, event_type: str, market_id: str, outcome_id: Optional[str], sequence: Optional[int]
     ) -> bool:
         if sequence is None:
             return False
-        key = f"{event_type}:{market_id}:{outcome_id or '*'}"
+        # Tuples hash faster than a formatted string and skip the per-message
+        # f-string allocation.
+        key = (event_type, market_id, outcome_id)
         previous = self._sequence_tracker.get(key)
         self._sequence_tracker[key] = sequence
         if previous is None:
@@ -409,65 +636,105 @@ class PolymarketClient:
     def _timing_metrics(self, data: Dict[str, Any]) -> tuple[Optional[float], Optional[float]]:
         timestamp = data.get("timestamp") or data.get("ts") or data.get("time")
         parsed = self._parse_timestamp(timestamp)
-        if not parsed:
+        if parsed is None:
             return None, None
-        now = datetime.now(timezone.utc)
-        delta = now - parsed
-        latency_ms = delta.total_seconds() * 1000.0
-        lag_seconds = delta.total_seconds()
-        self._emit_metrics("latency", {"latency_ms": latency_ms, "lag_seconds": lag_seconds})
+        lag_seconds = time.time() - parsed
+        latency_ms = lag_seconds * 1000.0
+        if self.metrics_callback:
+            self._latency_buffer.append(parsed)
+            if (
+                len(self._latency_buffer) >= LATENCY_BATCH_SIZE
+                or time.monotonic() - self._latency_last_flush >= LATENCY_FLUSH_SECONDS
+            ):
+                self._flush_latency_metrics()
         return latency_ms, lag_seconds
 
-    def _parse_timestamp(self, timestamp: Any) -> Optional[datetime]:
+    def _flush_latency_metrics(self) -> None:
+        """Emit one aggregated latency metric for the buffered timestamps.
+
+        The vector math runs in NumPy when available; a burst of frames then
+        costs a single array pass and one callback instead of a dict
+        allocation and callback per message.
+        """
+
+        if not self._latency_buffer:
+            return
+        now = time.time()
+        count = len(self._latency_buffer)
+        if np is not None:
+            lags = now - np.fromiter(self._latency_buffer, dtype=np.float64, count=count)
+            lag_mean = float(lags.mean())
+            lag_max = float(lags.max())
+        else:
+            lags = [now - ts for ts in self._latency_buffer]
+            lag_mean = sum(lags) / count
+            lag_max = max(lags)
+        self._latency_buffer.clear()
+        self._latency_last_flush = time.monotonic()
+        self._emit_metrics(
+            "latency",
+            {
+                "latency_ms": lag_mean * 1000.0,
+                "lag_seconds": lag_mean,
+                "lag_seconds_max": lag_max,
+                "samples": float(count),
+            },
+        )
+
+    def _parse_timestamp(self, timestamp: Any) -> Optional[float]:
+        """Coerce a feed timestamp into epoch seconds."""
+
         if timestamp is None:
             return None
         if isinstance(timestamp, (int, float)):
             if timestamp > 1e12:
                 timestamp /= 1000.0
-            return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+            return float(timestamp)
         if isinstance(timestamp, str):
-            for parser in (self._parse_iso, self._parse_numeric_string):
-                parsed = parser(timestamp)
-                if parsed:
-                    return parsed
+            parsed = _parse_iso_cached(timestamp)
+            if parsed is not None:
+                return parsed
+            numeric = _parse_numeric_string_cached(timestamp)
+            if numeric is not None:
+                return self._parse_timestamp(numeric)
         return None
 
-    def _parse_iso(self, value: str) -> Optional[datetime]:
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
-        except ValueError:
-            return None
-
-    def _parse_numeric_string(self, value: str) -> Optional[datetime]:
-        try:
-            numeric = float(value)
-        except ValueError:
-            return None
-        return self._parse_timestamp(numeric)
-
-    def _safe_float(self, value: Any) -> Optional[float]:
-        try:
-            if value is None:
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
-    def _safe_int(self, value: Any) -> Optional[int]:
-        try:
-            if value is None:
-                return None
-            return int(value)
-        except (TypeError, ValueError):
-            return None
-
     def _emit_metrics(self, name: str, values: Dict[str, float]) -> None:
         if not self.metrics_callback:
             return
-        try:
-            self.metrics_callback(name, values)
-        except Exception as exc:  # pragma: no cover - external callback safety
-            self.logger.debug("Metric callback failed for %s: %s", name, exc)
+        self._metrics_buffer[name].append(values)
+        self._metrics_buffered += 1
+        if (
+            self._metrics_buffered >= METRICS_BUFFER_LIMIT
+            or time.monotonic() - self._metrics_last_flush >= METRICS_FLUSH_SECONDS
+        ):
+            self._flush_metrics()
+
+    def _flush_metrics(self) -> None:
+        """Deliver buffered emissions as one aggregated callback per name."""
+
+        if not self._metrics_buffered:
+            return
+        buffered = self._metrics_buffer
+        self._metrics_buffer = defaultdict(list)
+        self._metrics_buffered = 0
+        self._metrics_last_flush = time.monotonic()
+        for name, samples in buffered.items():
+            if len(samples) == 1:
+                aggregated = dict(samples[0])
+            else:
+                totals: Dict[str, float] = {}
+                counts: Dict[str, int] = {}
+                for sample in samples:
+                    for field_name, value in sample.items():
+                        totals[field_name] = totals.get(field_name, 0.0) + value
+                        counts[field_name] = counts.get(field_name, 0) + 1
+                aggregated = {field_name: totals[field_name] / counts[field_name] for field_name in totals}
+            aggregated["samples"] = float(len(samples))
+            try:
+                self.metrics_callback(name, aggregated)
+            except Exception as exc:  # pragma: no cover - external callback safety
+                self.logger.debug("Metric callback failed for %s: %s", name, exc)
 
 
 __all__ = ["PolymarketClient", "BackoffConfig", "NormalizedMarketData"]
@@ -1,7 +1,39 @@
 """WebSocket subscription helpers for streaming market data."""
 
+import logging
+import socket
 from dataclasses import dataclass
-from typing import Callable
+from typing import Any, Callable, Optional
+
+#: Kernel buffer size applied to streaming sockets; sized for the
+#: bandwidth-delay product of high-RTT venue links.
+DEFAULT_SOCKET_BUFFER_BYTES = 4 * 1024 * 1024
+
+
+def tune_stream_socket(
+    ws: Any,
+    buffer_bytes: int = DEFAULT_SOCKET_BUFFER_BYTES,
+    logger: Optional[logging.Logger] = None,
+) -> None:
+    """Raise kernel socket buffers and disable Nagle on a connected WebSocket.
+
+    Larger SO_RCVBUF/SO_SNDBUF keep a high-latency pipe full during bursts
+    and TCP_NODELAY avoids delaying small subscribe/ping frames. Failures
+    are logged at debug level and otherwise ignored, since buffer limits
+    are platform policy.
+    """
+
+    transport = getattr(ws, "transport", None)
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_bytes)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_bytes)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError as exc:  # pragma: no cover - platform dependent
+        if logger:
+            logger.debug("Socket tuning failed: %s", exc)
 
 
 @dataclass
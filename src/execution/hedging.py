@@ -9,8 +9,9 @@ gate on availability.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
-import uuid
+import secrets
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Protocol
 
@@ -71,6 +72,7 @@ class HedgeExecutor:
         timeout_seconds: float = 5.0,
         max_failures: int = 3,
         metrics: Optional[MetricsSink] = None,
+        max_concurrent: int = 8,
     ) -> None:
         self.order_manager = order_manager
         self.client = client or NoopHedgeClient()
@@ -80,6 +82,15 @@ class HedgeExecutor:
         self.failure_streak = 0
         self.circuit_open = False
         self.metrics = metrics
+        self.max_concurrent = max_concurrent
+        self._submit_semaphore = asyncio.Semaphore(max_concurrent)
+        # A venue keeps using the same fill field, so remember the winning
+        # key and probe it first on subsequent responses.
+        self._preferred_fill_key: Optional[str] = None
+        # Process-start nonce plus a counter keeps IDs unique and sortable
+        # without paying uuid4 entropy/format cost per order.
+        self._nonce = secrets.token_hex(4)
+        self._counter = itertools.count()
 
     async def submit_hedges(self, hedge_actions: Iterable[HedgeAction]) -> List[OrderState]:
         """Submit all hedge actions, returning their tracked order states."""
@@ -91,7 +102,7 @@ class HedgeExecutor:
             )
             return []
 
-        states: List[OrderState] = []
+        valid: List[HedgeAction] = []
         for action in hedge_actions:
             if action.size <= 0:
                 self.logger.info(
@@ -99,11 +110,29 @@ class HedgeExecutor:
                     extra={"event": "hedge_skipped", "symbol": action.symbol, "size": action.size},
                 )
                 continue
+            valid.append(action)
+
+        if not valid:
+            return []
 
-            state = await self._submit(action)
-            states.append(state)
+        # Submit concurrently so wall time is one round trip, not N; the
+        # semaphore bounds in-flight orders per venue.
+        # _submit converts its own failures into the tracked state, so only
+        # cancellation and other non-Exception failures surface here.
+        results = await asyncio.gather(
+            *(self._submit_bounded(action) for action in valid), return_exceptions=True
+        )
+        states: List[OrderState] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            states.append(result)
         return states
 
+    async def _submit_bounded(self, action: HedgeAction) -> OrderState:
+        async with self._submit_semaphore:
+            return await self._submit(action)
+
     async def _submit(self, action: HedgeAction) -> OrderState:
         order_id = self._generate_order_id("hedge")
         request = OrderRequest(
@@ -138,6 +167,17 @@ class HedgeExecutor:
             self._record_failure()
             self._record_metric("hedge_timeout", {"symbol": action.symbol})
             return state
+        except Exception as exc:
+            # Convert failures on the recorded state so the order tracked in
+            # OrderManager is the one surfaced, not a fabricated ID.
+            self.logger.error(
+                "Hedge submission raised for %s: %s", action.symbol, exc,
+                extra={"event": "hedge_error", "symbol": action.symbol, "order_id": order_id},
+            )
+            state.status = "error"
+            self._record_failure()
+            self._record_metric("hedge_error", {"symbol": action.symbol})
+            return state
 
         if self._was_rejected(response):
             state.status = "rejected"
@@ -147,25 +187,37 @@ class HedgeExecutor:
 
         filled = self._extract_filled_quantity(response)
         if filled > 0:
-            self.order_manager.update_fill(order_id, filled)
-            state = self.order_manager.get_order(order_id)
+            state = self.order_manager.update_fill(order_id, filled)
             self._record_success()
             self._record_metric("hedge_filled", {"symbol": action.symbol, "filled": filled})
         else:
             self._record_success()
         return state
 
+    _FILL_KEYS = ("filled", "filled_size", "filled_qty", "fill", "filledQuantity")
+
     def _extract_filled_quantity(self, response: Optional[dict]) -> float:
         if not response:
             return 0.0
-        for key in ("filled", "filled_size", "filled_qty", "fill", "filledQuantity"):
+        preferred = self._preferred_fill_key
+        if preferred is not None:
+            filled = response.get(preferred)
+            if isinstance(filled, (int, float)):
+                return float(filled)
+        for key in self._FILL_KEYS:
             filled = response.get(key)
             if filled is None:
                 continue
-            try:
+            if isinstance(filled, (int, float)):
+                self._preferred_fill_key = key
                 return float(filled)
-            except (TypeError, ValueError):
-                continue
+            if isinstance(filled, str):
+                try:
+                    value = float(filled)
+                except ValueError:
+                    continue
+                self._preferred_fill_key = key
+                return value
         return 0.0
 
     def _was_rejected(self, response: Optional[dict]) -> bool:
@@ -193,7 +245,7 @@ class HedgeExecutor:
         self._record_metric("hedge_success", {"failure_streak": self.failure_streak})
 
     def _generate_order_id(self, prefix: str) -> str:
-        return f"{prefix}-{uuid.uuid4().hex}"
+        return f"{prefix}-{self._nonce}-{next(self._counter):x}"
 
     def _record_metric(self, event: str, payload: dict) -> None:
         if not self.metrics:
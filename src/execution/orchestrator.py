@@ -23,7 +23,7 @@ class ArbitrageOrchestrator:
         if not opportunity:
             return None
 
-        market = self.detector.snapshot().get(opportunity.market_id)
+        market = self.detector.market_book(opportunity.market_id)
         if market is None:
             return None
 
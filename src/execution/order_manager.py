@@ -1,13 +1,13 @@
 """Order management primitives for placing and tracking orders."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, List, Literal
 
 OrderSide = Literal["buy", "sell"]
 OrderType = Literal["limit", "market"]
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRequest:
     """A request to place an order on a venue."""
 
@@ -18,7 +18,7 @@ class OrderRequest:
     price: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderState:
     """Tracks the lifecycle of a submitted order."""
 
@@ -39,8 +39,12 @@ class OrderManager:
 
         self._orders[state.order_id] = state
 
-    def update_fill(self, order_id: str, fill_quantity: float) -> None:
-        """Apply a fill update to the tracked order."""
+    def update_fill(self, order_id: str, fill_quantity: float) -> OrderState:
+        """Apply a fill update to the tracked order and return it.
+
+        Returning the state saves callers a get_order lookup right after
+        the update.
+        """
 
         order = self._orders[order_id]
         order.filled_quantity += fill_quantity
@@ -48,6 +52,7 @@ class OrderManager:
             order.status = "filled"
         else:
             order.status = "partial_fill"
+        return order
 
     def list_orders(self) -> List[OrderState]:
         """Return the current known orders."""
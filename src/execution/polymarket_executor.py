@@ -8,26 +8,69 @@ captures partial fills via the shared :class:`OrderManager`.
 from __future__ import annotations
 
 import asyncio
-import inspect
+import hashlib
+import itertools
 import json
 import logging
+import os
 import time
-import uuid
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol
 
 from src.execution.hedging import HedgeExecutor
 from src.execution.order_manager import OrderManager, OrderRequest, OrderState
 from src.infra.persistence import FileSystemBackend, SnapshotStore, SQLiteStorageBackend
 from src.infra.metrics import MetricsSink
-from src.pricing.market_arbitrage import CompleteSetOpportunity, MarketBook, OutcomeQuote
+from src.pricing.market_arbitrage import CompleteSetOpportunity, MarketBook
 from src.risk.inventory import InventoryCaps
 from src.risk.limits import RiskLimits
 from src.risk.pnl import PnLTracker
 
 
+#: Venue statuses that terminate a leg; hoisted so _extract_status does a
+#: single membership test per response.
+_REJECT_STATUSES = frozenset({"reject", "rejected", "error"})
+
+#: Client order IDs only need uniqueness within the venue's TTL; pid plus
+#: start time plus a counter avoids a urandom read per leg.
+_ID_PREFIX = f"{os.getpid():x}{int(time.time()):x}"
+_ID_COUNTER = itertools.count()
+
+
+#: Coroutine-ness per underlying function; the set of venue methods is tiny
+#: and process-lived, so the cache never needs eviction.
+_IS_CORO_CACHE: Dict[Any, bool] = {}
+
+
+def _is_coroutine_function(func: Any) -> bool:
+    """Cached asyncio.iscoroutinefunction.
+
+    Bound methods are recreated on every attribute access, so the cache
+    keys on the stable underlying function instead of the method object.
+    """
+
+    target = getattr(func, "__func__", func)
+    is_coro = _IS_CORO_CACHE.get(target)
+    if is_coro is None:
+        is_coro = _IS_CORO_CACHE[target] = asyncio.iscoroutinefunction(func)
+    return is_coro
+
+
 class PolymarketTradingClient(Protocol):
     """Thin protocol describing the minimal trading surface used by the executor."""
 
@@ -45,25 +88,49 @@ class PolymarketTradingClient(Protocol):
     async def mint_complete_set(self, market_id: str, size: float, client_order_id: str) -> Dict[str, Any]:
         ...
 
+    # Optional batch capability: clients that can submit all legs in one
+    # signed request set supports_batch = True and implement
+    # place_orders_batch; the executor probes via getattr and falls back to
+    # per-order submission otherwise.
+    supports_batch: bool
+
+    async def place_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        ...
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecutionConfig:
-    """Runtime parameters for execution safety."""
+    """Runtime parameters for execution safety.
+
+    Frozen so derived values cached by the executor (slippage multipliers,
+    pool sizing) can never drift from the live config; use
+    ``dataclasses.replace`` to vary a field.
+    """
 
     max_fee_bps: float = 100.0
     max_slippage_pct: float = 0.01
     dry_run: bool = False
     timeout_seconds: float = 5.0
     idempotency_ttl_seconds: float = 60.0
+    #: Hard cap on tracked idempotency keys; oldest entries evict first.
+    idempotency_max_entries: int = 4096
     max_data_staleness_seconds: float = 10.0
     max_reject_streak: int = 3
     max_hedge_failures: int = 3
+    #: Ceiling on in-flight order submissions; legs still gather in
+    #: parallel but never exceed the venue's rate tolerance.
+    max_concurrent_orders: int = 8
+    #: Keep-alive pool size for the trading client's HTTP session; sized so
+    #: all legs of concurrent opportunities reuse warm connections.
+    http_pool_size: int = 32
     snapshot_backend: str = "file"  # "file" or "sqlite"
     snapshot_path: str = "data/snapshots"
     snapshot_name: str = "risk_state"
+    #: Minimum spacing between persisted snapshots; fill bursts coalesce.
+    snapshot_min_interval_seconds: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionReport:
     """Outcome of an execution attempt."""
 
@@ -72,7 +139,7 @@ class ExecutionReport:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Tracks signed quantity and average entry price."""
 
@@ -110,11 +177,62 @@ class PolymarketExecutor:
             self.hedge_executor.metrics = metrics or getattr(self.hedge_executor, "metrics", None)
         self.logger = logger or logging.getLogger(__name__)
         self.metrics = metrics
-        self._recent_opportunities: Dict[str, float] = {}
+        # Config is immutable during operation; derive the slippage
+        # multipliers once instead of per outcome.
+        self._slip_up = 1.0 + self.config.max_slippage_pct
+        self._slip_dn = 1.0 - self.config.max_slippage_pct
+        self._order_semaphore = asyncio.Semaphore(self.config.max_concurrent_orders)
+        # Resolve coroutine-ness of the client hooks up front so the first
+        # live order skips the reflective check too. Sync clients work but
+        # pay a thread-pool handoff per leg, so flag them once here.
+        for hook in (getattr(client, "place_order", None), getattr(client, "mint_complete_set", None)):
+            if hook is not None and not _is_coroutine_function(hook):
+                self.logger.warning(
+                    "Trading client hook %s is synchronous; each call costs a thread-pool handoff",
+                    getattr(hook, "__name__", hook),
+                )
+        self._configure_http_pool()
+        # LRU-with-TTL: insertion order doubles as recency order, so stale
+        # or excess entries pop from the head and memory stays bounded.
+        self._recent_opportunities: "OrderedDict[int, float]" = OrderedDict()
+        # Ask/bid sums per (market, snapshot timestamp); one opportunity
+        # consults them several times, so each snapshot is summed once.
+        self._field_sum_cache: "OrderedDict[tuple, float]" = OrderedDict()
         self._positions: Dict[str, Position] = {}
         self._inventory: Dict[str, float] = {}
+        # Running realized-loss total so the pre-trade loss check is O(1)
+        # instead of a scan over every tracked symbol; seeded from any
+        # state the injected tracker already carries.
+        self._realized_by_symbol: Dict[str, float] = {
+            symbol: pnl.realized for symbol, pnl in self.pnl_tracker.positions.items()
+        }
+        self._realized_loss_sum = sum(
+            -realized for realized in self._realized_by_symbol.values() if realized < 0
+        )
         self._reject_streak = 0
         self._halted_reason: Optional[str] = None
+        # Shared extra= buffer for the hot skip logs.
+        self._extra_buf: Dict[str, Any] = {}
+        # Interned "market:outcome" symbols; each pair formats once.
+        self._symbol_cache: Dict[tuple, str] = {}
+        # Learned response-schema keys for the fill extractors.
+        self._filled_key: Optional[str] = None
+        self._filled_key_misses = 0
+        self._price_key: Optional[str] = None
+        self._price_key_misses = 0
+        self._last_snapshot_digest: Optional[bytes] = None
+        self._last_snapshot_ts = 0.0
+        # Per-symbol material-state digests; fills that change nothing do
+        # not reach the snapshot path at all.
+        self._symbol_digest: Dict[str, bytes] = {}
+        # Latest-wins handoff to a background writer so fills never wait on
+        # disk; started lazily once a running loop exists.
+        self._snapshot_queue: Optional[asyncio.Queue] = None
+        self._snapshot_task: Optional["asyncio.Task"] = None
+        # Updates arriving inside the min interval mark state dirty and arm
+        # one trailing flush, so a burst's final state still hits disk.
+        self._snapshot_dirty = False
+        self._snapshot_flush_handle: Optional[asyncio.TimerHandle] = None
 
     async def execute_complete_set(
         self, opportunity: CompleteSetOpportunity, market: MarketBook, size: Optional[float] = None
@@ -134,17 +252,11 @@ class PolymarketExecutor:
 
         key = self._opportunity_key(opportunity)
         if not self._claim_idempotency(key):
-            self.logger.info(
-                "Skipping duplicate opportunity for %s", opportunity.market_id,
-                extra={"event": "idempotent_skip", "market_id": opportunity.market_id, "direction": opportunity.direction},
-            )
+            self._log_skip("idempotent_skip", "Skipping duplicate opportunity for %s", opportunity)
             return ExecutionReport(skipped=True, reason="duplicate")
 
         if not self._edge_survives_costs(opportunity, market):
-            self.logger.info(
-                "Edge eliminated by projected costs for %s", opportunity.market_id,
-                extra={"event": "edge_erased", "market_id": opportunity.market_id, "direction": opportunity.direction},
-            )
+            self._log_skip("edge_erased", "Edge eliminated by projected costs for %s", opportunity)
             return ExecutionReport(skipped=True, reason="edge_erased")
 
         trade_size = min(size or opportunity.max_size, opportunity.max_size)
@@ -163,30 +275,43 @@ class PolymarketExecutor:
         return ExecutionReport(orders=orders, skipped=False)
 
     async def _buy_complete_set(self, market_id: str, market: MarketBook, size: float) -> List[OrderState]:
-        orders: List[OrderState] = []
-        for quote in self._iter_outcomes(market, require_field="ask"):
-            limit_price = quote.ask * (1 + self.config.max_slippage_pct)
+        legs = []
+        for quote in market.askable:
+            limit_price = quote.ask * self._slip_up
             order_id = self._generate_order_id("buy")
             request = OrderRequest(
-                symbol=f"{market_id}:{quote.outcome_id}",
+                symbol=self._symbol_for(market_id, quote.outcome_id),
                 side="buy",
                 order_type="market",
                 quantity=size,
                 price=limit_price,
             )
-            state = await self._submit_order(
+            legs.append((request, order_id, quote.outcome_id, "buy", limit_price))
+
+        if self._use_batch_endpoint():
+            return await self._submit_batch(market_id, market, legs)
+
+        # All legs race in parallel so a K-outcome set costs one round trip,
+        # not K; the shorter window also limits mid-drift between legs.
+        submissions = [
+            (
                 request,
-                market,
                 order_id,
-                self.client.place_order,
-                market_id,
-                quote.outcome_id,
-                "buy",
-                size,
-                limit_price,
+                self._submit_order(
+                    request,
+                    market,
+                    order_id,
+                    self.client.place_order,
+                    market_id,
+                    outcome_id,
+                    side,
+                    size,
+                    limit_price,
+                ),
             )
-            orders.append(state)
-        return orders
+            for request, order_id, outcome_id, side, limit_price in legs
+        ]
+        return await self._gather_orders(submissions)
 
     async def _sell_complete_set(self, market_id: str, market: MarketBook, size: float) -> List[OrderState]:
         orders: List[OrderState] = []
@@ -201,28 +326,128 @@ class PolymarketExecutor:
         )
         orders.append(mint_state)
 
-        for quote in self._iter_outcomes(market, require_field="bid"):
-            limit_price = quote.bid * (1 - self.config.max_slippage_pct)
+        # The mint must settle first; the per-outcome sells then follow.
+        legs = []
+        for quote in market.biddable:
+            limit_price = quote.bid * self._slip_dn
             order_id = self._generate_order_id("sell")
             request = OrderRequest(
-                symbol=f"{market_id}:{quote.outcome_id}",
+                symbol=self._symbol_for(market_id, quote.outcome_id),
                 side="sell",
                 order_type="market",
                 quantity=size,
                 price=limit_price,
             )
-            state = await self._submit_order(
+            legs.append((request, order_id, quote.outcome_id, "sell", limit_price))
+
+        if self._use_batch_endpoint():
+            orders.extend(await self._submit_batch(market_id, market, legs))
+            return orders
+
+        submissions = [
+            (
                 request,
-                market,
                 order_id,
-                self.client.place_order,
-                market_id,
-                quote.outcome_id,
-                "sell",
-                size,
-                limit_price,
+                self._submit_order(
+                    request,
+                    market,
+                    order_id,
+                    self.client.place_order,
+                    market_id,
+                    outcome_id,
+                    side,
+                    size,
+                    limit_price,
+                ),
             )
-            orders.append(state)
+            for request, order_id, outcome_id, side, limit_price in legs
+        ]
+        orders.extend(await self._gather_orders(submissions))
+        return orders
+
+    def _use_batch_endpoint(self) -> bool:
+        """Whether all legs can go to the venue in one signed request.
+
+        Dry runs keep the per-order path so fills are still simulated leg
+        by leg.
+        """
+
+        return (
+            not self.config.dry_run
+            and getattr(self.client, "supports_batch", False)
+            and callable(getattr(self.client, "place_orders_batch", None))
+        )
+
+    async def _submit_batch(
+        self, market_id: str, market: MarketBook, legs: List[tuple]
+    ) -> List[OrderState]:
+        """Submit all legs through the venue's batch endpoint.
+
+        Responses pair with legs by index; a missing or short response list
+        leaves the remaining legs in their submitted state.
+        """
+
+        states: List[OrderState] = []
+        payloads: List[Dict[str, Any]] = []
+        for request, order_id, outcome_id, side, limit_price in legs:
+            state = OrderState(order_id=order_id, request=request)
+            self.order_manager.record_submission(state)
+            states.append(state)
+            payloads.append(
+                {
+                    "market_id": market_id,
+                    "outcome_id": outcome_id,
+                    "side": side,
+                    "size": request.quantity,
+                    "limit_price": limit_price,
+                    "client_order_id": order_id,
+                }
+            )
+
+        try:
+            responses = await self._call_with_timeout(self.client.place_orders_batch, payloads)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                "Batch order timed out for %s", market_id,
+                extra={"event": "order_timeout", "market_id": market_id, "legs": len(states)},
+            )
+            self._record_metric("order_timeout", {"symbol": market_id})
+            for state in states:
+                state.status = "timeout"
+            self._handle_reject()
+            return states
+
+        responses = responses or []
+        return [
+            self._apply_order_response(state, responses[index] if index < len(responses) else None, market)
+            for index, state in enumerate(states)
+        ]
+
+    async def _gather_orders(
+        self, submissions: List[tuple[OrderRequest, str, Any]]
+    ) -> List[OrderState]:
+        """Run order submissions concurrently, preserving input order.
+
+        _submit_order already converts timeouts and venue rejections into
+        terminal OrderStates; anything that still escapes is mapped to a
+        rejected state so a single bad leg cannot lose the others.
+        """
+
+        if not submissions:
+            return []
+        results = await asyncio.gather(*(coro for _, _, coro in submissions), return_exceptions=True)
+        orders: List[OrderState] = []
+        for (request, order_id, _), result in zip(submissions, results):
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    "Order submission raised for %s: %s", request.symbol, result,
+                    extra={"event": "order_error", "order_id": order_id, "symbol": request.symbol},
+                )
+                state = OrderState(order_id=order_id, request=request, status="rejected")
+                self._handle_reject()
+                orders.append(state)
+                continue
+            orders.append(result)
         return orders
 
     async def _submit_order(
@@ -238,7 +463,8 @@ class PolymarketExecutor:
         if self.config.dry_run:
             return self._simulate_fill(state, market)
         try:
-            response = await self._call_with_timeout(func, *args, client_order_id=order_id)
+            async with self._order_semaphore:
+                response = await self._call_with_timeout(func, *args, client_order_id=order_id)
         except asyncio.TimeoutError:
             self.logger.warning(
                 "Order timed out for %s", request.symbol,
@@ -249,25 +475,67 @@ class PolymarketExecutor:
             self._handle_reject()
             return state
 
+        return self._apply_order_response(state, response, market)
+
+    def _apply_order_response(
+        self, state: OrderState, response: Optional[Dict[str, Any]], market: MarketBook
+    ) -> OrderState:
         status = self._extract_status(response)
         if status == "rejected":
             state.status = "rejected"
             self._handle_reject()
-            self._record_metric("order_rejected", {"symbol": request.symbol})
+            self._record_metric("order_rejected", {"symbol": state.request.symbol})
             return state
 
         filled = self._extract_filled_quantity(response)
         if filled > 0:
-            self.order_manager.update_fill(order_id, filled)
-            state = self.order_manager.get_order(order_id)
+            state = self.order_manager.update_fill(state.order_id, filled)
             self._record_fill(state.request, filled, response, market)
             self._reject_streak = 0
         return state
 
+    def _configure_http_pool(self) -> None:
+        """Size the trading client's keep-alive pool for parallel legs.
+
+        The client is otherwise a black box; if it exposes a requests-style
+        session the adapter is remounted with the configured pool size so
+        concurrent submissions do not pay a TCP/TLS handshake per leg.
+        Async clients (httpx/aiohttp) fix their limits at construction and
+        are left alone.
+        """
+
+        session = getattr(self.client, "session", None)
+        if session is None or not hasattr(session, "mount"):
+            return
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=self.config.http_pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    async def warmup(self) -> None:
+        """Pre-negotiate venue connections before the first opportunity.
+
+        Delegates to an optional client warmup hook (typically a cheap GET)
+        so TLS is established ahead of the first live order.
+        """
+
+        hook = getattr(self.client, "warmup", None)
+        if hook is None:
+            return
+        try:
+            await self._call_with_timeout(hook)
+        except Exception as exc:  # pragma: no cover - network dependent
+            self.logger.debug("Connection warmup failed: %s", exc)
+
     async def _call_with_timeout(self, func: Any, *args: Any, **kwargs: Any) -> Any:
-        if inspect.iscoroutinefunction(func):
-            return await asyncio.wait_for(func(*args, **kwargs), timeout=self.config.timeout_seconds)
-        return await asyncio.wait_for(asyncio.to_thread(func, *args, **kwargs), timeout=self.config.timeout_seconds)
+        # asyncio.timeout arms loop.call_later on the current task instead
+        # of spawning the wrapper task asyncio.wait_for needs; TimeoutError
+        # semantics are identical on 3.11+.
+        async with asyncio.timeout(self.config.timeout_seconds):
+            if _is_coroutine_function(func):
+                return await func(*args, **kwargs)
+            return await asyncio.to_thread(func, *args, **kwargs)
 
     def _default_snapshot_store(self) -> SnapshotStore:
         path = Path(self.config.snapshot_path)
@@ -278,7 +546,7 @@ class PolymarketExecutor:
         return SnapshotStore(backend)
 
     def _is_market_stale(self, market: MarketBook) -> bool:
-        age_seconds = (datetime.now(timezone.utc) - market.last_update).total_seconds()
+        age_seconds = time.time() - market.last_update_ts
         if age_seconds <= self.config.max_data_staleness_seconds:
             return False
         self.logger.error(
@@ -299,25 +567,30 @@ class PolymarketExecutor:
         self._record_metric("circuit_breaker", {"reason": reason})
 
     def _edge_survives_costs(self, opportunity: CompleteSetOpportunity, market: MarketBook) -> bool:
-        fee_multiplier = 1 + (market.fee_bps or 0) / 10_000
+        fee_multiplier = market.fee_multiplier
         if opportunity.direction == "buy_set":
+            # One-sided book: nothing to lift, skip the sums entirely.
+            if not market.askable:
+                return False
             ask_sum = self._sum_field(market, field="ask")
             if ask_sum <= 0:
                 return False
-            projected = ask_sum * (1 + self.config.max_slippage_pct) * fee_multiplier
+            projected = ask_sum * self._slip_up * fee_multiplier
             return projected < 1.0
 
+        if not market.biddable:
+            return False
         bid_sum = self._sum_field(market, field="bid")
         if bid_sum <= 0:
             return False
-        projected = bid_sum * (1 - self.config.max_slippage_pct) / fee_multiplier
+        projected = bid_sum * self._slip_dn / fee_multiplier
         return projected > 1.0
 
     def _estimate_notional(self, opportunity: CompleteSetOpportunity, market: MarketBook, size: float) -> float:
         if opportunity.direction == "buy_set":
-            unit = self._sum_field(market, field="ask") * (1 + self.config.max_slippage_pct)
+            unit = self._sum_field(market, field="ask") * self._slip_up
         else:
-            unit = self._sum_field(market, field="bid") * (1 - self.config.max_slippage_pct)
+            unit = self._sum_field(market, field="bid") * self._slip_dn
         return max(unit, 0.0) * size
 
     def _passes_risk_limits(
@@ -343,10 +616,20 @@ class PolymarketExecutor:
             return False
         return True
 
+    #: Outcome count at which the vectorized risk check beats the scalar loop.
+    _BATCH_RISK_MIN_OUTCOMES = 8
+
     def _positions_within_limits(
         self, opportunity: CompleteSetOpportunity, market: MarketBook, trade_size: float
     ) -> bool:
         projections = self._projected_inventory(opportunity, market, trade_size)
+        if (
+            np is not None
+            and len(projections) >= self._BATCH_RISK_MIN_OUTCOMES
+            and (self.inventory_caps is None or hasattr(self.inventory_caps, "within_caps_batch"))
+            and (self.risk_limits is None or hasattr(self.risk_limits, "validate_position_batch"))
+        ):
+            return self._positions_within_limits_batch(projections)
         for symbol, projected in projections.items():
             if self.inventory_caps and not self.inventory_caps.within_caps(symbol, projected):
                 self.logger.warning(
@@ -362,14 +645,43 @@ class PolymarketExecutor:
                 return False
         return True
 
+    def _positions_within_limits_batch(self, projections: Dict[str, float]) -> bool:
+        """Vectorized limit check for wide categorical markets.
+
+        One C-level comparison per validator replaces K interpreter trips;
+        symbols stay aligned with the projection array by insertion order.
+        """
+
+        symbols = list(projections)
+        projected = np.fromiter(projections.values(), dtype=float, count=len(symbols))
+        if self.inventory_caps is not None:
+            ok = self.inventory_caps.within_caps_batch(symbols, projected)
+            if not ok.all():
+                breached = [symbols[i] for i in np.flatnonzero(~ok)]
+                self.logger.warning(
+                    "Inventory cap breached for %s", breached,
+                    extra={"event": "inventory_cap", "symbols": breached},
+                )
+                return False
+        if self.risk_limits is not None:
+            ok = self.risk_limits.validate_position_batch(symbols, projected)
+            if not ok.all():
+                breached = [symbols[i] for i in np.flatnonzero(~ok)]
+                self.logger.warning(
+                    "Risk position limit breached for %s", breached,
+                    extra={"event": "risk_position_limit", "symbols": breached},
+                )
+                return False
+        return True
+
     def _projected_inventory(
         self, opportunity: CompleteSetOpportunity, market: MarketBook, trade_size: float
     ) -> Dict[str, float]:
         projections: Dict[str, float] = {}
         delta = trade_size if opportunity.direction == "buy_set" else -trade_size
-        field = "ask" if opportunity.direction == "buy_set" else "bid"
-        for quote in self._iter_outcomes(market, require_field=field):
-            symbol = f"{market.market_id}:{quote.outcome_id}"
+        quotes = market.askable if opportunity.direction == "buy_set" else market.biddable
+        for quote in quotes:
+            symbol = self._symbol_for(market.market_id, quote.outcome_id)
             current = self._positions.get(symbol, Position(symbol)).quantity
             projections[symbol] = current + delta
 
@@ -379,24 +691,42 @@ class PolymarketExecutor:
             projections[mint_symbol] = current_mint + trade_size
         return projections
 
+    def _add_realized(self, symbol: str, delta: float) -> None:
+        """Record realized PnL, keeping the running loss sum in step.
+
+        Only the loss portion counts toward the daily limit, so the sum
+        moves by the change in this symbol's loss contribution.
+        """
+
+        old = self._realized_by_symbol.get(symbol, 0.0)
+        new = old + delta
+        self._realized_by_symbol[symbol] = new
+        self._realized_loss_sum += max(0.0, -new) - max(0.0, -old)
+        self.pnl_tracker.add_realized(symbol, delta)
+
     def _current_realized_loss(self) -> float:
-        losses = [-p.realized for p in self.pnl_tracker.positions.values() if p.realized < 0]
-        return sum(losses)
+        return self._realized_loss_sum
+
+    #: Upper bound on cached (market, timestamp, field) sums.
+    _FIELD_SUM_CACHE_MAX = 1024
 
     def _sum_field(self, market: MarketBook, field: str) -> float:
-        total = 0.0
-        for quote in self._iter_outcomes(market, require_field=field):
-            value = getattr(quote, field)
-            if value is not None:
-                total += value
-        return total
-
-    def _iter_outcomes(self, market: MarketBook, require_field: str) -> Iterable[OutcomeQuote]:
-        for quote in market.outcome_quotes():
-            value = getattr(quote, require_field)
-            if value is None:
-                continue
-            yield quote
+        cache = self._field_sum_cache
+        key = (market.market_id, market.last_update_ts, field)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Both sums land in the cache together; a fresh snapshot gets a
+        # fresh timestamp, so invalidation is implicit in the key. The
+        # reductions themselves are vectorized on the book's SoA arrays.
+        ask_sum = market.ask_sum()
+        bid_sum = market.bid_sum()
+        cache[(market.market_id, market.last_update_ts, "ask")] = ask_sum
+        cache[(market.market_id, market.last_update_ts, "bid")] = bid_sum
+        while len(cache) > self._FIELD_SUM_CACHE_MAX:
+            cache.popitem(last=False)
+        return ask_sum if field == "ask" else bid_sum
 
     def _handle_reject(self) -> None:
         self._reject_streak += 1
@@ -409,24 +739,41 @@ class PolymarketExecutor:
     ) -> None:
         symbol = request.symbol
         price = self._extract_fill_price(response, request)
-        position = self._positions.get(symbol, Position(symbol))
-        updated, realized = self._apply_fill_to_position(position, request.side, filled_quantity, price)
-        self._positions[symbol] = updated
-        self._inventory[symbol] = updated.quantity
+        position = self._positions.setdefault(symbol, Position(symbol))
+        realized = self._apply_fill_to_position(position, request.side, filled_quantity, price)
+        self._inventory[symbol] = position.quantity
         self._record_metric(
             "order_filled",
-            {"symbol": symbol, "filled": filled_quantity, "price": price, "avg_position": updated.avg_price},
+            {"symbol": symbol, "filled": filled_quantity, "price": price, "avg_position": position.avg_price},
         )
 
         if realized != 0:
-            self.pnl_tracker.add_realized(symbol, realized)
-
-        self._mark_unrealized(symbol, updated, market)
-        self._persist_snapshot()
-
-    def _apply_fill_to_position(
-        self, position: Position, side: str, quantity: float, price: float
-    ) -> tuple[Position, float]:
+            self._add_realized(symbol, realized)
+
+        self._mark_unrealized(symbol, position, market)
+
+        # Skip the snapshot entirely when the fill left the symbol's
+        # persisted state unchanged (FP round-off, zero-impact fills);
+        # the whole-payload digest in _persist_snapshot never gets built.
+        # Hash cumulative PnL, not the fill's delta: identical round-trips
+        # repeat the delta while the persisted totals keep moving.
+        pnl = self.pnl_tracker.positions.get(symbol)
+        realized_total = pnl.realized if pnl else 0.0
+        unrealized = pnl.unrealized if pnl else 0.0
+        digest = hashlib.blake2b(
+            f"{position.quantity!r}{position.avg_price!r}{realized_total!r}{unrealized!r}".encode(),
+            digest_size=8,
+        ).digest()
+        if self._symbol_digest.get(symbol) != digest:
+            self._symbol_digest[symbol] = digest
+            self._persist_snapshot()
+
+    def _apply_fill_to_position(self, position: Position, side: str, quantity: float, price: float) -> float:
+        """Fold a fill into the position in place, returning realized PnL.
+
+        The position lives in self._positions already, so mutation avoids
+        allocating a replacement object per fill.
+        """
         realized = 0.0
         remaining = quantity
         new_qty = position.quantity
@@ -461,7 +808,9 @@ class PolymarketExecutor:
                     new_qty -= remaining
                     avg_price = ((total_short * avg_price) + (remaining * price)) / abs(new_qty)
 
-        return Position(position.symbol, new_qty, avg_price), realized
+        position.quantity = new_qty
+        position.avg_price = avg_price
+        return realized
 
     def _mark_unrealized(self, symbol: str, position: Position, market: MarketBook) -> None:
         mark = self._mark_price(symbol, market)
@@ -489,6 +838,90 @@ class PolymarketExecutor:
     def _persist_snapshot(self) -> None:
         if not self.snapshot_store:
             return
+        now = time.monotonic()
+        wait = self.config.snapshot_min_interval_seconds - (now - self._last_snapshot_ts)
+        if wait > 0:
+            # Don't drop the update: mark dirty and arm one trailing flush
+            # for when the interval expires. Without a running loop (sync
+            # callers) there is nothing to schedule on, so persist inline.
+            self._snapshot_dirty = True
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                if self._snapshot_flush_handle is None:
+                    self._snapshot_flush_handle = loop.call_later(wait, self._flush_pending_snapshot)
+                return
+        self._write_snapshot(now)
+
+    def _flush_pending_snapshot(self) -> None:
+        self._snapshot_flush_handle = None
+        if self._snapshot_dirty:
+            self._write_snapshot(time.monotonic())
+
+    def _write_snapshot(self, now: float) -> None:
+        self._snapshot_dirty = False
+        payload = self._encode_snapshot()
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self._last_snapshot_digest:
+            return
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync callers, shutdown paths): persist inline.
+            try:
+                self.snapshot_store.persist_snapshot(self.config.snapshot_name, payload)
+            except Exception as exc:  # pragma: no cover - defensive persistence guard
+                self.logger.warning("Snapshot persistence failed: %s", exc)
+                return
+        else:
+            if self._snapshot_queue is None:
+                self._snapshot_queue = asyncio.Queue(maxsize=1)
+                self._snapshot_task = asyncio.get_running_loop().create_task(self._snapshot_writer_loop())
+            # Latest wins: drop any queued payload before enqueueing this one.
+            while not self._snapshot_queue.empty():
+                self._snapshot_queue.get_nowait()
+            self._snapshot_queue.put_nowait(payload)
+
+        self._last_snapshot_digest = digest
+        self._last_snapshot_ts = now
+
+    async def _snapshot_writer_loop(self) -> None:
+        """Persist queued snapshots off the event loop, one at a time."""
+
+        while True:
+            payload = await self._snapshot_queue.get()
+            try:
+                await asyncio.to_thread(self.snapshot_store.persist_snapshot, self.config.snapshot_name, payload)
+            except Exception as exc:  # pragma: no cover - defensive persistence guard
+                self.logger.warning("Snapshot persistence failed: %s", exc)
+
+    async def close(self) -> None:
+        """Stop the snapshot writer, flushing anything still queued."""
+
+        task = self._snapshot_task
+        self._snapshot_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._snapshot_flush_handle is not None:
+            self._snapshot_flush_handle.cancel()
+            self._snapshot_flush_handle = None
+        if self._snapshot_dirty and self.snapshot_store:
+            self._snapshot_dirty = False
+            payload = self._encode_snapshot()
+            await asyncio.to_thread(self.snapshot_store.persist_snapshot, self.config.snapshot_name, payload)
+        if self._snapshot_queue is not None:
+            while not self._snapshot_queue.empty():
+                payload = self._snapshot_queue.get_nowait()
+                await asyncio.to_thread(self.snapshot_store.persist_snapshot, self.config.snapshot_name, payload)
+
+    def _encode_snapshot(self) -> bytes:
         payload = {
             "positions": {symbol: {"quantity": pos.quantity, "avg_price": pos.avg_price} for symbol, pos in self._positions.items()},
             "inventory": self._inventory,
@@ -497,33 +930,68 @@ class PolymarketExecutor:
                 for symbol, pnl in self.pnl_tracker.positions.items()
             },
         }
-        try:
-            self.snapshot_store.persist_snapshot(self.config.snapshot_name, json.dumps(payload).encode("utf-8"))
-        except Exception as exc:  # pragma: no cover - defensive persistence guard
-            self.logger.warning("Snapshot persistence failed: %s", exc)
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload).encode("utf-8")
+
+    #: Candidate response keys, in descending likelihood. The concrete
+    #: client returns a stable schema, so the winning key is remembered and
+    #: subsequent responses take a single dict lookup; two consecutive
+    #: misses (schema change) drop the learned key.
+    _FILL_KEYS = ("filled", "filled_size", "filled_qty", "fill", "filledQuantity", "minted")
+    _PRICE_KEYS = ("price", "avg_price", "average_price", "fill_price")
+    _KEY_MISS_LIMIT = 2
+
+    @staticmethod
+    def _coerce_float(value: Any) -> Optional[float]:
+        # isinstance fast path keeps the common numeric case off the
+        # exception machinery; strings still parse.
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                return None
+        return None
 
     def _extract_filled_quantity(self, response: Optional[Dict[str, Any]]) -> float:
         if not response:
             return 0.0
-        for key in ("filled", "filled_size", "filled_qty", "fill", "filledQuantity", "minted"):
-            filled = response.get(key)
+        key = self._filled_key
+        if key is not None:
+            filled = self._coerce_float(response.get(key))
             if filled is not None:
-                try:
-                    return float(filled)
-                except (TypeError, ValueError):
-                    continue
+                self._filled_key_misses = 0
+                return filled
+            self._filled_key_misses += 1
+            if self._filled_key_misses >= self._KEY_MISS_LIMIT:
+                self._filled_key = None
+        for key in self._FILL_KEYS:
+            filled = self._coerce_float(response.get(key))
+            if filled is not None:
+                self._filled_key = key
+                self._filled_key_misses = 0
+                return filled
         return 0.0
 
     def _extract_fill_price(self, response: Optional[Dict[str, Any]], request: OrderRequest) -> float:
         if response:
-            for key in ("price", "avg_price", "average_price", "fill_price"):
-                price = response.get(key)
-                if price is None:
-                    continue
-                try:
-                    return float(price)
-                except (TypeError, ValueError):
-                    continue
+            key = self._price_key
+            if key is not None:
+                price = self._coerce_float(response.get(key))
+                if price is not None:
+                    self._price_key_misses = 0
+                    return price
+                self._price_key_misses += 1
+                if self._price_key_misses >= self._KEY_MISS_LIMIT:
+                    self._price_key = None
+            for key in self._PRICE_KEYS:
+                price = self._coerce_float(response.get(key))
+                if price is not None:
+                    self._price_key = key
+                    self._price_key_misses = 0
+                    return price
         if request.price is not None:
             return float(request.price)
         return 1.0
@@ -531,26 +999,72 @@ class PolymarketExecutor:
     def _extract_status(self, response: Optional[Dict[str, Any]]) -> Optional[str]:
         if not response:
             return None
-        status = response.get("status") or response.get("state")
-        if status and str(status).lower() in {"reject", "rejected", "error"}:
+        if (status := response.get("status") or response.get("state")) and str(status).lower() in _REJECT_STATUSES:
             return "rejected"
         if response.get("rejected") is True:
             return "rejected"
         return None
 
-    def _claim_idempotency(self, key: str) -> bool:
+    def _claim_idempotency(self, key: int) -> bool:
         now = time.monotonic()
-        recent = self._recent_opportunities.get(key)
-        if recent and now - recent < self.config.idempotency_ttl_seconds:
+        recent = self._recent_opportunities
+        ttl = self.config.idempotency_ttl_seconds
+
+        # Lazily evict expired entries from the head; recency order means
+        # the first live entry ends the scan.
+        while recent:
+            oldest_key, oldest_ts = next(iter(recent.items()))
+            if now - oldest_ts < ttl:
+                break
+            del recent[oldest_key]
+
+        claimed = recent.get(key)
+        if claimed is not None and now - claimed < ttl:
+            recent.move_to_end(key)
             return False
-        self._recent_opportunities[key] = now
+        recent[key] = now
+        recent.move_to_end(key)
+        while len(recent) > self.config.idempotency_max_entries:
+            recent.popitem(last=False)
         return True
 
-    def _opportunity_key(self, opportunity: CompleteSetOpportunity) -> str:
-        return f"{opportunity.market_id}:{opportunity.direction}:{round(opportunity.edge, 6)}"
+    def _symbol_for(self, market_id: str, outcome_id: str) -> str:
+        """Memoized "market:outcome" symbol for a pair.
+
+        The pair set is small and stable, so every consumer shares one
+        interned string instead of re-formatting per outcome per pass.
+        """
+
+        key = (market_id, outcome_id)
+        symbol = self._symbol_cache.get(key)
+        if symbol is None:
+            symbol = self._symbol_cache[key] = f"{market_id}:{outcome_id}"
+        return symbol
+
+    def _opportunity_key(self, opportunity: CompleteSetOpportunity) -> int:
+        # The key only ever feeds the idempotency map, so a tuple hash
+        # beats formatting a throwaway string that the dict re-hashes.
+        return hash((opportunity.market_id, opportunity.direction, round(opportunity.edge, 6)))
 
     def _generate_order_id(self, prefix: str) -> str:
-        return f"{prefix}-{uuid.uuid4().hex}"
+        return f"{prefix}-{_ID_PREFIX}-{next(_ID_COUNTER):x}"
+
+    def _log_skip(self, event: str, message: str, opportunity: CompleteSetOpportunity) -> None:
+        """Emit a hot-path skip log without per-call dict allocation.
+
+        These fire on every duplicate or erased opportunity, so the
+        ``extra`` payload reuses one buffer; logging copies extras into
+        the LogRecord synchronously, making mutation afterwards safe.
+        """
+
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        buf = self._extra_buf
+        buf.clear()
+        buf["event"] = event
+        buf["market_id"] = opportunity.market_id
+        buf["direction"] = opportunity.direction
+        self.logger.info(message, opportunity.market_id, extra=buf)
 
     def _record_metric(self, event: str, payload: Dict[str, Any]) -> None:
         if not self.metrics:
@@ -1,17 +1,23 @@
 """Route orders to venues based on latency and availability."""
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 from src.execution.hedging import HedgeAction
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoutePreference:
     """Preferred routing strategy for a symbol."""
 
     primary: str
     secondary: Optional[str] = None
+    #: Venues in try order, derived once so routing never rebuilds it.
+    order: Tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        order = (self.primary, self.secondary) if self.secondary else (self.primary,)
+        object.__setattr__(self, "order", order)
 
 
 class ExecutionRouter:
@@ -20,15 +26,18 @@ class ExecutionRouter:
     def __init__(self, latency_budget_ms: int, preferences: Dict[str, RoutePreference]):
         self.latency_budget_ms = latency_budget_ms
         self.preferences = preferences
+        # Symbol -> venue try order, flattened from the preference objects
+        # so the hit path is a dict get plus tuple iteration.
+        self._pref_order: Dict[str, Tuple[str, ...]] = {
+            symbol: preference.order for symbol, preference in preferences.items()
+        }
 
     def choose_venue(self, symbol: str, venue_latencies_ms: Dict[str, int]) -> Optional[str]:
         """Select a venue under the latency budget, respecting preferences."""
 
-        preference = self.preferences.get(symbol)
-        if preference:
-            for venue_name in self._preference_order(preference):
-                if self._within_budget(venue_name, venue_latencies_ms):
-                    return venue_name
+        for venue_name in self._pref_order.get(symbol, ()):
+            if self._within_budget(venue_name, venue_latencies_ms):
+                return venue_name
         return self._fastest_within_budget(venue_latencies_ms)
 
     def plan_opportunity(
@@ -44,20 +53,23 @@ class ExecutionRouter:
             return None
         return RoutedOpportunity(primary_venue=venue, hedge_actions=hedge_actions or [])
 
-    def _preference_order(self, preference: RoutePreference) -> Iterable[str]:
-        if preference.secondary:
-            return (preference.primary, preference.secondary)
-        return (preference.primary,)
-
     def _within_budget(self, venue_name: str, venue_latencies_ms: Dict[str, int]) -> bool:
         latency = venue_latencies_ms.get(venue_name)
         return latency is not None and latency <= self.latency_budget_ms
 
     def _fastest_within_budget(self, venue_latencies_ms: Dict[str, int]) -> Optional[str]:
-        eligible = {name: latency for name, latency in venue_latencies_ms.items() if latency <= self.latency_budget_ms}
-        if not eligible:
-            return None
-        return min(eligible, key=eligible.get)
+        # Single fused pass: no intermediate eligible dict, one comparison
+        # per venue instead of a filter followed by min().
+        budget = self.latency_budget_ms
+        best_name: Optional[str] = None
+        best_latency = 0
+        for name, latency in venue_latencies_ms.items():
+            if latency > budget:
+                continue
+            if best_name is None or latency < best_latency:
+                best_name = name
+                best_latency = latency
+        return best_name
 
 
 @dataclass
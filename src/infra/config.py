@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TradingPairConfig:
     symbol: str
     min_order_size: float
@@ -20,7 +26,7 @@ class TradingPairConfig:
     latency_budget_ms: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VenueConfig:
     name: str
     rest_url: str
@@ -29,34 +35,34 @@ class VenueConfig:
     trading_pairs: List[TradingPairConfig]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoutingConfig:
     default_venue: str
     failover_venue: Optional[str]
     latency_budget_ms: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskConfig:
     max_notional_usd: float
     max_position_sizes: Dict[str, float]
     daily_loss_limit_usd: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PersistenceConfig:
     database_url: str
     snapshot_interval_seconds: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DashboardConfig:
     host: str = "0.0.0.0"
     port: int = 8000
     enable: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     api_keys: Dict[str, str]
     venues: List[VenueConfig]
@@ -70,11 +76,19 @@ class AppConfig:
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_YamlLoader) or {}
 
 
 def load_config(path: str | Path) -> AppConfig:
-    cfg = _load_yaml(Path(path))
+    """Load the app config, memoized until the file changes on disk."""
+
+    resolved = Path(path).resolve()
+    return _load_config_cached(str(resolved), resolved.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(resolved: str, mtime_ns: int) -> AppConfig:
+    cfg = _load_yaml(Path(resolved))
 
     def tp(item: Dict[str, Any]) -> TradingPairConfig:
         return TradingPairConfig(
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Mapping, Optional
 
 
 @dataclass
@@ -18,24 +20,42 @@ class MetricsSink:
     gauges: Dict[str, float] = field(default_factory=dict)
     metrics_file: Path = Path("var/metrics.prom")
     emit_textfile: bool = False
+    #: Minimum spacing between textfile rewrites; updates in between stay
+    #: buffered in memory and land on the next flush.
+    flush_interval_seconds: float = 1.0
     logger: logging.Logger = field(default_factory=lambda: logging.getLogger("metrics"))
     _lock: threading.Lock = field(init=False, repr=False)
+    _dirty: bool = field(default=False, init=False, repr=False)
+    _last_flush: float = field(default=0.0, init=False, repr=False)
+    _flush_task: Optional["asyncio.Task"] = field(default=None, init=False, repr=False)
+    #: Pre-formatted exposition lines, maintained per mutation so a flush
+    #: is a join instead of an O(N log N) sort-and-format.
+    _counter_lines: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _gauge_lines: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._lock = threading.Lock()
+        for name, value in self.counters.items():
+            self._counter_lines[name] = f"{name} {int(value)}"
+        for name, value in self.gauges.items():
+            self._gauge_lines[name] = f"{name} {float(value)}"
 
     def incr(self, name: str, value: int = 1) -> None:
         """Increment a counter."""
 
         with self._lock:
-            self.counters[name] = self.counters.get(name, 0) + value
+            new_value = self.counters.get(name, 0) + value
+            self.counters[name] = new_value
+            self._counter_lines[name] = f"{name} {int(new_value)}"
             self._persist_unlocked()
 
     def set_gauge(self, name: str, value: float) -> None:
         """Set a gauge value."""
 
         with self._lock:
-            self.gauges[name] = float(value)
+            gauge_value = float(value)
+            self.gauges[name] = gauge_value
+            self._gauge_lines[name] = f"{name} {gauge_value}"
             self._persist_unlocked()
 
     def observe(self, name: str, values: Mapping[str, Any]) -> None:
@@ -43,10 +63,15 @@ class MetricsSink:
 
         with self._lock:
             counter_name = f"{name}_total"
-            self.counters[counter_name] = self.counters.get(counter_name, 0) + 1
+            count = self.counters.get(counter_name, 0) + 1
+            self.counters[counter_name] = count
+            self._counter_lines[counter_name] = f"{counter_name} {count}"
             for key, value in values.items():
                 if isinstance(value, (int, float)):
-                    self.gauges[f"{name}_{key}"] = float(value)
+                    gauge_name = f"{name}_{key}"
+                    gauge_value = float(value)
+                    self.gauges[gauge_name] = gauge_value
+                    self._gauge_lines[gauge_name] = f"{gauge_name} {gauge_value}"
             self._persist_unlocked()
         self.log_event(name, dict(values))
 
@@ -63,6 +88,42 @@ class MetricsSink:
         extras = {"event": event, **(payload or {})}
         self.logger.info(event, extra=extras)
 
+    def flush(self) -> None:
+        """Write any buffered updates to the textfile immediately."""
+
+        with self._lock:
+            if self._dirty:
+                self._flush_unlocked(time.monotonic())
+
+    def start_background_flush(self) -> None:
+        """Flush buffered updates on a timer from the running event loop.
+
+        Without this, updates that arrive during a quiet period sit
+        buffered until the next metric mutation.
+        """
+
+        if self._flush_task is not None:
+            return
+        self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Stop the background flusher and write anything still buffered."""
+
+        task = self._flush_task
+        self._flush_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            self.flush()
+
     def _persist(self) -> None:
         with self._lock:
             self._persist_unlocked()
@@ -70,6 +131,16 @@ class MetricsSink:
     def _persist_unlocked(self) -> None:
         if not self.emit_textfile:
             return
+        # Rewriting the whole textfile per mutation is pure IO overhead;
+        # mark dirty and let the interval (or an explicit flush) amortize
+        # the render and os.replace across many events.
+        self._dirty = True
+        now = time.monotonic()
+        if now - self._last_flush < self.flush_interval_seconds:
+            return
+        self._flush_unlocked(now)
+
+    def _flush_unlocked(self, now: float) -> None:
         try:
             self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
             payload = self._render_prom_text()
@@ -78,11 +149,12 @@ class MetricsSink:
             os.replace(temp_path, self.metrics_file)
         except Exception:
             return
+        self._dirty = False
+        self._last_flush = now
 
     def _render_prom_text(self) -> str:
-        lines = []
-        for name, value in sorted(self.counters.items()):
-            lines.append(f"{name} {int(value)}")
-        for name, value in sorted(self.gauges.items()):
-            lines.append(f"{name} {float(value)}")
+        # Lines are formatted at mutation time; the exposition format does
+        # not require sorted output, so insertion order is fine.
+        lines = list(self._counter_lines.values())
+        lines.extend(self._gauge_lines.values())
         return "\n".join(lines) + "\n"
@@ -1,10 +1,11 @@
 """Simple persistence interface for snapshots."""
 
+import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-import sqlite3
-from typing import Protocol
+from typing import Iterable, Protocol, Tuple
 
 
 class StorageBackend(Protocol):
@@ -43,15 +44,25 @@ class FileSystemBackend:
 
 
 class SQLiteStorageBackend:
-    """Persist snapshots to a SQLite database."""
+    """Persist snapshots to a SQLite database.
+
+    One connection is held for the backend's lifetime in WAL mode, so
+    saves skip the per-call open/parse/fsync cost of a fresh connection
+    and commit without stalling readers.
+    """
 
     def __init__(self, path: Path):
         self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
         self._initialize()
 
     def _initialize(self) -> None:
-        with sqlite3.connect(self.path) as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS snapshots (
                     key TEXT PRIMARY KEY,
@@ -62,9 +73,29 @@ class SQLiteStorageBackend:
             )
 
     def save(self, key: str, payload: bytes) -> None:
-        with sqlite3.connect(self.path) as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 "INSERT OR REPLACE INTO snapshots (key, payload) VALUES (?, ?)",
                 (key, payload),
             )
-            conn.commit()
+
+    def save_many(self, items: Iterable[Tuple[str, bytes]]) -> None:
+        """Persist a batch of snapshots in a single transaction."""
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO snapshots (key, payload) VALUES (?, ?)",
+                    items,
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Release the held connection."""
+
+        with self._lock:
+            self._conn.close()
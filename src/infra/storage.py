@@ -2,25 +2,110 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Dict, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from .persistence import StorageBackend
 
+#: Userspace buffer per open JSONL handle; bursts coalesce into one write().
+_WRITE_BUFFER_BYTES = 1 << 20
+
+#: Ceiling on cached handles so a long tail of keys cannot exhaust fds.
+_MAX_OPEN_HANDLES = 128
+
 
 class JsonLinesStorage(StorageLinesStorageBackend := StorageBackend):
-    """Append-only JSONL storage suitable for dry-run audit logs."""
+    """Append-only JSONL storage suitable for dry-run audit logs.
+
+    File handles stay open per key with a large write buffer, so streaming
+    appends skip the open/close syscalls and most write() calls; ``flush``
+    and the atexit hook make buffered records durable.
+    """
 
     def __init__(self, base_dir: str | Path = "var/logs") -> None:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._handles: Dict[str, BinaryIO] = {}
+        atexit.register(self.close)
+
+    def _handle(self, key: str) -> BinaryIO:
+        fh = self._handles.pop(key, None)
+        if fh is None:
+            if len(self._handles) >= _MAX_OPEN_HANDLES:
+                self._evict_oldest()
+            path = self.base_dir / f"{key}.jsonl"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fh = path.open("ab", buffering=_WRITE_BUFFER_BYTES)
+        # Re-insertion keeps the dict in recency order, so eviction always
+        # closes the least recently written key.
+        self._handles[key] = fh
+        return fh
+
+    def _evict_oldest(self) -> None:
+        oldest = next(iter(self._handles))
+        fh = self._handles.pop(oldest)
+        try:
+            fh.close()
+        except OSError:  # pragma: no cover - best-effort eviction
+            pass
 
     def save(self, key: str, payload: bytes) -> None:
-        path = self.base_dir / f"{key}.jsonl"
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("ab") as f:
-            f.write(payload + b"\n")
+        self._handle(key).write(payload + b"\n")
+
+    def append(self, key: str, record: Dict[str, Any]) -> None:
+        """Append a single record as one JSON line."""
+
+        self.append_many(key, [record])
+
+    def append_many(self, key: str, records: Iterable[Dict[str, Any]]) -> None:
+        """Append a batch of records with a single write call."""
+
+        if orjson is not None:
+            payload = b"".join(orjson.dumps(record, default=str) + b"\n" for record in records)
+        else:
+            payload = "".join(json.dumps(record, default=str) + "\n" for record in records).encode("utf-8")
+        if not payload:
+            return
+        self._handle(key).write(payload)
+
+    def append_lines(self, key: str, lines: Iterable[bytes]) -> None:
+        """Append pre-encoded JSON lines with a single binary write."""
+
+        payload = b"\n".join(lines)
+        if not payload:
+            return
+        self._handle(key).write(payload + b"\n")
+
+    def flush(self, key: str | None = None) -> None:
+        """Push buffered lines to disk for one key, or all of them."""
+
+        if key is not None:
+            fh = self._handles.get(key)
+            if fh is not None:
+                fh.flush()
+            return
+        for fh in self._handles.values():
+            fh.flush()
+
+    def close(self) -> None:
+        """Flush and release every open handle."""
+
+        handles, self._handles = self._handles, {}
+        for fh in handles.values():
+            try:
+                fh.close()
+            except OSError:  # pragma: no cover - best-effort shutdown
+                pass
+
 
+# Historical import name used by the entry points.
+JsonlStore = JsonLinesStorage
 
-__all__ = ["JsonLinesStorage"]
+__all__ = ["JsonLinesStorage", "JsonlStore"]
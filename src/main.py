@@ -12,6 +12,11 @@ from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 import yaml
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
 from src.data.polymarket_client import BackoffConfig, NormalizedMarketData, PolymarketClient
 from src.infra.logging import configure_logging
 from src.infra.metrics import MetricsSink
@@ -76,23 +81,45 @@ class MarketStreamApp:
 
         self.max_lag_seconds = float(polymarket_config.get("max_lag_seconds", DEFAULT_MAX_LAG_SECONDS))
         self.client = build_polymarket_client(polymarket_config, self.logger, self.metrics)
+        # With a debounce configured, bursty ticks on one market coalesce
+        # into a single detection run per interval instead of one per tick.
+        self.detect_debounce_seconds = float(arbitrage_config.get("detect_debounce_ms", 0.0)) / 1000
         self.detector = MarketArbitrageDetector(
             min_edge_bps=float(arbitrage_config.get("min_edge_bps", 10.0)),
+            coalesce=self.detect_debounce_seconds > 0,
         )
         self.dry_run = bool(trading_config.get("dry_run", False))
         self.max_slippage_bps = float(trading_config.get("max_slippage_bps", 0.0))
         self.max_orders_per_minute = int(trading_config.get("max_orders_per_minute", 0))
 
-        self._sequence_tracker: Dict[str, int] = {}
+        self._sequence_tracker: Dict[tuple, int] = {}
+        # Static log-payload fields per (market_id, direction); hot markets
+        # re-emit the same identity fields on every opportunity.
+        self._payload_templates: Dict[tuple, Dict[str, Any]] = {}
 
     async def run(self) -> None:
         """Consume the Polymarket stream and surface arbitrage opportunities."""
 
-        async for data in self.client.stream():
-            processed = await self._prepare_data(data)
-            if not processed:
-                continue
-            self._handle_opportunity(processed)
+        detection_task: Optional[asyncio.Task] = None
+        if self.detect_debounce_seconds > 0:
+            detection_task = asyncio.create_task(self._detection_loop())
+        try:
+            async for data in self.client.stream():
+                processed = await self._prepare_data(data)
+                if not processed:
+                    continue
+                self._handle_opportunity(processed)
+        finally:
+            if detection_task is not None:
+                detection_task.cancel()
+
+    async def _detection_loop(self) -> None:
+        """Periodically evaluate markets touched since the last pass."""
+
+        while True:
+            await asyncio.sleep(self.detect_debounce_seconds)
+            for opportunity in self.detector.detect_dirty():
+                self._emit_opportunity(opportunity)
 
     async def _prepare_data(self, data: NormalizedMarketData) -> Optional[NormalizedMarketData]:
         """Drop or replace stale/gapped events with fresh REST snapshots."""
@@ -119,16 +146,19 @@ class MarketStreamApp:
     def _has_sequence_gap(self, data: NormalizedMarketData) -> bool:
         if data.sequence is None:
             return False
-        key = f"{data.type}:{data.market_id}:{data.outcome_id or '*'}"
+        # Tuple keys hash the existing strings directly; the display form is
+        # only formatted when a gap actually needs to be reported.
+        key = (data.type, data.market_id, data.outcome_id)
         previous = self._sequence_tracker.get(key)
         self._sequence_tracker[key] = data.sequence
         if previous is None or data.sequence == previous + 1:
             return False
 
         gap = data.sequence - previous - 1
+        key_label = f"{data.type}:{data.market_id}:{data.outcome_id or '*'}"
         self.logger.warning(
-            "Sequence gap detected (%s -> %s) for %s", previous, data.sequence, key,
-            extra={"event": "sequence_gap", "key": key, "previous": previous, "current": data.sequence, "gap": gap},
+            "Sequence gap detected (%s -> %s) for %s", previous, data.sequence, key_label,
+            extra={"event": "sequence_gap", "key": key_label, "previous": previous, "current": data.sequence, "gap": gap},
         )
         return True
 
@@ -136,14 +166,10 @@ class MarketStreamApp:
         """Fetch a REST snapshot to replace missing or stale data."""
 
         if data.type.startswith("order_book"):
-            snapshot = await asyncio.to_thread(
-                self.client.fetch_order_book_snapshot, data.market_id, data.outcome_id
-            )
+            snapshot = await self.client.fetch_order_book_snapshot_async(data.market_id, data.outcome_id)
             channel = "orderbook"
         elif data.type.startswith("trade"):
-            snapshot = await asyncio.to_thread(
-                self.client.fetch_trades_snapshot, data.market_id, data.outcome_id
-            )
+            snapshot = await self.client.fetch_trades_snapshot_async(data.market_id, data.outcome_id)
             channel = "trades"
         else:
             return None
@@ -173,7 +199,9 @@ class MarketStreamApp:
         opportunity = self.detector.ingest(data)
         if not opportunity:
             return
+        self._emit_opportunity(opportunity)
 
+    def _emit_opportunity(self, opportunity: CompleteSetOpportunity) -> None:
         edge_bps = opportunity.edge * 10_000
         self.metrics.observe(
             "edge_detected",
@@ -191,18 +219,23 @@ class MarketStreamApp:
         )
 
     def _opportunity_payload(self, opportunity: CompleteSetOpportunity) -> Dict[str, Any]:
-        return {
-            "event": "arbitrage_opportunity",
-            "market_id": opportunity.market_id,
-            "direction": opportunity.direction,
-            "edge": opportunity.edge,
-            "notional": opportunity.notional,
-            "max_size": opportunity.max_size,
-            "details": opportunity.details,
-            "dry_run": self.dry_run,
-            "max_slippage_bps": self.max_slippage_bps,
-            "max_orders_per_minute": self.max_orders_per_minute,
-        }
+        key = (opportunity.market_id, opportunity.direction)
+        template = self._payload_templates.get(key)
+        if template is None:
+            template = self._payload_templates[key] = {
+                "event": "arbitrage_opportunity",
+                "market_id": opportunity.market_id,
+                "direction": opportunity.direction,
+                "dry_run": self.dry_run,
+                "max_slippage_bps": self.max_slippage_bps,
+                "max_orders_per_minute": self.max_orders_per_minute,
+            }
+        payload = dict(template)
+        payload["edge"] = opportunity.edge
+        payload["notional"] = opportunity.notional
+        payload["max_size"] = opportunity.max_size
+        payload["details"] = opportunity.details
+        return payload
 
 
 def _parse_args() -> argparse.Namespace:
@@ -250,6 +283,8 @@ def main() -> None:
     config = load_config(Path(args.config))
     config = _apply_cli_overrides(config, args)
     app = MarketStreamApp(config)
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(app.run())
 
 
@@ -1,10 +1,15 @@
 """Expected value estimation for trading opportunities."""
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Sequence
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Opportunity:
     """Represents a tradeable opportunity with probability and payoff."""
 
@@ -25,3 +30,31 @@ class ExpectedValueCalculator:
                 raise ValueError("Probability must be between 0 and 1")
             ev += opportunity.probability * (opportunity.payoff - opportunity.cost)
         return ev
+
+    def evaluate_arrays(
+        self,
+        probabilities: Sequence[float],
+        payoffs: Sequence[float],
+        costs: Sequence[float],
+    ) -> float:
+        """Return total expected value over parallel probability/payoff/cost arrays.
+
+        Portfolio-level callers holding columnar data skip the per-object
+        loop: validation and the reduction both run as vectorized numpy
+        operations when numpy is available.
+        """
+
+        if np is None:
+            ev = 0.0
+            for probability, payoff, cost in zip(probabilities, payoffs, costs):
+                if not 0 <= probability <= 1:
+                    raise ValueError("Probability must be between 0 and 1")
+                ev += probability * (payoff - cost)
+            return ev
+
+        prob = np.asarray(probabilities, dtype=np.float64)
+        if ((prob < 0) | (prob > 1)).any():
+            raise ValueError("Probability must be between 0 and 1")
+        payoff = np.asarray(payoffs, dtype=np.float64)
+        cost = np.asarray(costs, dtype=np.float64)
+        return float((prob * (payoff - cost)).sum())
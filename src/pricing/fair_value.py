@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Iterable
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     """Represents a best bid/ask pair."""
 
@@ -23,14 +23,21 @@ class FairValueCalculator:
 
     def __init__(self, spread_buffer_bps: float = 0):
         self.spread_buffer_bps = spread_buffer_bps
+        # Buffer as a multiplier, computed once instead of per call.
+        self._buffer_multiplier = 1 + spread_buffer_bps / 10_000
 
     def from_quotes(self, quotes: Iterable[Quote]) -> float:
         """Compute a buffered mid across quotes."""
 
-        mids = [quote.mid for quote in quotes]
-        if not mids:
+        # Single pass with the mid inlined: no list of mids and no property
+        # call per quote; halving once at the end is equivalent.
+        total = 0.0
+        count = 0
+        for quote in quotes:
+            total += quote.bid + quote.ask
+            count += 1
+        if not count:
             raise ValueError("No quotes provided for fair value calculation")
 
-        base_fair = sum(mids) / len(mids)
-        buffer = base_fair * (self.spread_buffer_bps / 10_000)
-        return base_fair + buffer
+        base_fair = total * 0.5 / count
+        return base_fair * self._buffer_multiplier
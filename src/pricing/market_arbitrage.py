@@ -9,18 +9,20 @@ best bids/asks and available size per outcome.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional
-
-from src.data.polymarket_client import NormalizedMarketData
+from typing import Dict, Iterable, List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
-def _now() -> datetime:
-    return datetime.now(timezone.utc)
+from src.data.polymarket_client import NormalizedMarketData
 
 
-@dataclass
+@dataclass(slots=True)
 class OutcomeQuote:
     """Top-of-book snapshot for a single outcome."""
 
@@ -29,38 +31,158 @@ class OutcomeQuote:
     ask: Optional[float] = None
     size: Optional[float] = None
     fee_bps: Optional[int] = None
-    updated_at: datetime = field(default_factory=_now)
+    #: Nanosecond epoch stamp; a datetime per book update is pure allocation
+    #: churn on a busy feed, so the object form is built lazily on access.
+    updated_at_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Update time as an aware datetime, for display and diagnostics."""
+
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9, tz=timezone.utc)
 
     def update_from(self, data: NormalizedMarketData) -> None:
         self.bid = data.bid if data.bid is not None else self.bid
         self.ask = data.ask if data.ask is not None else self.ask
         self.size = data.size if data.size is not None else self.size
         self.fee_bps = data.fee_bps if data.fee_bps is not None else self.fee_bps
-        self.updated_at = _now()
+        self.updated_at_ns = time.time_ns()
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketBook:
     """Aggregated order book state across all outcomes in a market."""
 
     market_id: str
     outcomes: Dict[str, OutcomeQuote] = field(default_factory=dict)
     fee_bps: Optional[int] = None
-    last_update: datetime = field(default_factory=_now)
+    #: Epoch-seconds stamp refreshed per ingest; staleness checks compare
+    #: floats and the datetime form is derived lazily via ``last_update``.
+    last_update_ts: float = field(default_factory=time.time)
+    #: Side-specific views over ``outcomes``, classified lazily once per book
+    #: update so downstream consumers stop re-filtering by ask/bid.
+    _askable: Optional[Tuple[OutcomeQuote, ...]] = field(default=None, repr=False)
+    _biddable: Optional[Tuple[OutcomeQuote, ...]] = field(default=None, repr=False)
+    #: SoA mirrors of the live ask/bid prices, built lazily alongside the
+    #: side classification so sums become C-level reductions.
+    _ask_array: Optional["np.ndarray"] = field(default=None, repr=False)
+    _bid_array: Optional["np.ndarray"] = field(default=None, repr=False)
+    _fee_multiplier: Optional[float] = field(default=None, repr=False)
+    _min_size: Optional[float] = field(default=None, repr=False)
 
     def update_from(self, data: NormalizedMarketData) -> None:
         outcome_id = data.outcome_id or "default"
-        outcome = self.outcomes.setdefault(outcome_id, OutcomeQuote(outcome_id))
+        # Two-step lookup: setdefault would construct a throwaway
+        # OutcomeQuote on every warm update.
+        outcome = self.outcomes.get(outcome_id)
+        if outcome is None:
+            outcome = self.outcomes[outcome_id] = OutcomeQuote(outcome_id)
         outcome.update_from(data)
-        if data.fee_bps is not None:
+        if data.fee_bps is not None and data.fee_bps != self.fee_bps:
             self.fee_bps = data.fee_bps
-        self.last_update = _now()
+            self._fee_multiplier = None
+        self.last_update_ts = time.time()
+        self._askable = None
+        self._biddable = None
+        self._ask_array = None
+        self._bid_array = None
+        self._min_size = None
+
+    @property
+    def last_update(self) -> datetime:
+        """Last ingest time as an aware datetime, for display and diagnostics."""
+
+        return datetime.fromtimestamp(self.last_update_ts, tz=timezone.utc)
+
+    @property
+    def askable(self) -> Tuple[OutcomeQuote, ...]:
+        """Quotes with a live ask."""
+
+        cached = self._askable
+        if cached is None:
+            cached = self._askable = tuple(q for q in self.outcomes.values() if q.ask is not None)
+        return cached
+
+    @property
+    def biddable(self) -> Tuple[OutcomeQuote, ...]:
+        """Quotes with a live bid."""
+
+        cached = self._biddable
+        if cached is None:
+            cached = self._biddable = tuple(q for q in self.outcomes.values() if q.bid is not None)
+        return cached
+
+    @property
+    def ask_array(self) -> Optional["np.ndarray"]:
+        """Live asks as a float array, or None when numpy is absent."""
+
+        if np is None:
+            return None
+        arr = self._ask_array
+        if arr is None:
+            askable = self.askable
+            arr = self._ask_array = np.fromiter(
+                (q.ask for q in askable), dtype=np.float64, count=len(askable)
+            )
+        return arr
+
+    @property
+    def bid_array(self) -> Optional["np.ndarray"]:
+        """Live bids as a float array, or None when numpy is absent."""
+
+        if np is None:
+            return None
+        arr = self._bid_array
+        if arr is None:
+            biddable = self.biddable
+            arr = self._bid_array = np.fromiter(
+                (q.bid for q in biddable), dtype=np.float64, count=len(biddable)
+            )
+        return arr
+
+    @property
+    def fee_multiplier(self) -> float:
+        """1 + fee in fractional terms, cached until the fee changes."""
+
+        multiplier = self._fee_multiplier
+        if multiplier is None:
+            multiplier = self._fee_multiplier = 1 + (self.fee_bps or 0) / 10_000
+        return multiplier
+
+    def ask_sum(self) -> float:
+        """Sum of live asks; a vectorized reduction when numpy is present."""
+
+        arr = self.ask_array
+        if arr is not None:
+            return float(arr.sum())
+        return sum(q.ask for q in self.askable)
+
+    def bid_sum(self) -> float:
+        """Sum of live bids; a vectorized reduction when numpy is present."""
+
+        arr = self.bid_array
+        if arr is not None:
+            return float(arr.sum())
+        return sum(q.bid for q in self.biddable)
+
+    def min_size(self) -> float:
+        """Smallest posted size across outcomes, 0.0 when none are posted."""
+
+        cached = self._min_size
+        if cached is None:
+            smallest: Optional[float] = None
+            for quote in self.outcomes.values():
+                size = quote.size
+                if size is not None and (smallest is None or size < smallest):
+                    smallest = size
+            cached = self._min_size = smallest if smallest is not None else 0.0
+        return cached
 
     def outcome_quotes(self) -> Iterable[OutcomeQuote]:
         return self.outcomes.values()
 
 
-@dataclass
+@dataclass(slots=True)
 class CompleteSetOpportunity:
     """Represents a detected complete-set arbitrage opportunity."""
 
@@ -86,76 +208,91 @@ class MarketArbitrageDetector:
     adding additional evaluators that consume the maintained MarketBook state.
     """
 
-    def __init__(self, min_edge_bps: float = 10.0) -> None:
+    def __init__(self, min_edge_bps: float = 10.0, coalesce: bool = False) -> None:
         self.min_edge_bps = min_edge_bps
+        #: When set, ``ingest`` only updates book state and marks the market
+        #: dirty; the caller drains coalesced detections via ``detect_dirty``.
+        self.coalesce = coalesce
         self._markets: Dict[str, MarketBook] = {}
+        self._dirty: set = set()
 
     def ingest(self, data: NormalizedMarketData) -> Optional[CompleteSetOpportunity]:
         if data.type not in {"order_book", "order_book_snapshot"}:
             return None
-        market = self._markets.setdefault(data.market_id, MarketBook(data.market_id))
+        market = self._markets.get(data.market_id)
+        if market is None:
+            market = self._markets[data.market_id] = MarketBook(data.market_id)
         market.update_from(data)
+        if self.coalesce:
+            self._dirty.add(data.market_id)
+            return None
         return self._detect_complete_set_arb(market)
 
-    def _detect_complete_set_arb(self, market: MarketBook) -> Optional[CompleteSetOpportunity]:
-        quotes = list(market.outcome_quotes())
-        if len(quotes) < 2:
-            return None
+    def detect_dirty(self) -> List[CompleteSetOpportunity]:
+        """Run detection once per market touched since the last drain.
 
-        fee_multiplier = 1 + (market.fee_bps or 0) / 10_000
-        ask_sum = 0.0
-        bid_sum = 0.0
-        sizes: List[float] = []
+        Burst ticks on the same market collapse into a single detection
+        against the latest book state.
+        """
 
-        for quote in quotes:
-            if quote.ask is not None:
-                ask_sum += quote.ask * fee_multiplier
-            if quote.bid is not None:
-                bid_sum += quote.bid * (2 - fee_multiplier)  # approximate fee-adjusted take-profit
-            if quote.size is not None:
-                sizes.append(quote.size)
+        dirty, self._dirty = self._dirty, set()
+        opportunities: List[CompleteSetOpportunity] = []
+        for market_id in dirty:
+            opportunity = self._detect_complete_set_arb(self._markets[market_id])
+            if opportunity:
+                opportunities.append(opportunity)
+        return opportunities
 
-        max_size = min(sizes) if sizes else 0.0
+    def _detect_complete_set_arb(self, market: MarketBook) -> Optional[CompleteSetOpportunity]:
+        if len(market.outcomes) < 2:
+            return None
+
+        max_size = market.min_size()
         if max_size <= 0:
             return None
 
-        opportunities: List[CompleteSetOpportunity] = []
+        # The fee scaling distributes over the sums, so the per-quote Python
+        # loop collapses to the book's cached (vectorized) reductions times
+        # a scalar.
+        fee_multiplier = market.fee_multiplier
+        ask_sum = market.ask_sum() * fee_multiplier
+        bid_sum = market.bid_sum() * (2 - fee_multiplier)  # approximate fee-adjusted take-profit
+
+        # Only two candidate directions ever exist, so pick the winner with
+        # scalar comparisons and build a single opportunity object instead
+        # of a list fed through max(). Buy wins ties, matching the old
+        # append order.
+        threshold = self.min_edge_bps / 10_000
         buy_edge = 1.0 - ask_sum
-        if self._edge_meets_threshold(buy_edge):
-            opportunities.append(
-                CompleteSetOpportunity(
-                    market_id=market.market_id,
-                    direction="buy_set",
-                    edge=buy_edge,
-                    notional=ask_sum,
-                    max_size=max_size,
-                    details={"ask_sum": ask_sum, "fee_bps": float(market.fee_bps or 0)},
-                )
-            )
-
         sell_edge = bid_sum - 1.0
-        if self._edge_meets_threshold(sell_edge):
-            opportunities.append(
-                CompleteSetOpportunity(
-                    market_id=market.market_id,
-                    direction="sell_set",
-                    edge=sell_edge,
-                    notional=bid_sum,
-                    max_size=max_size,
-                    details={"bid_sum": bid_sum, "fee_bps": float(market.fee_bps or 0)},
-                )
+        buy_ok = buy_edge >= threshold
+        sell_ok = sell_edge >= threshold
+        if not buy_ok and not sell_ok:
+            return None
+
+        if buy_ok and (not sell_ok or buy_edge >= sell_edge):
+            return CompleteSetOpportunity(
+                market_id=market.market_id,
+                direction="buy_set",
+                edge=buy_edge,
+                notional=ask_sum,
+                max_size=max_size,
+                details={"ask_sum": ask_sum, "fee_bps": float(market.fee_bps or 0)},
             )
 
-        return self._best_opportunity(opportunities)
+        return CompleteSetOpportunity(
+            market_id=market.market_id,
+            direction="sell_set",
+            edge=sell_edge,
+            notional=bid_sum,
+            max_size=max_size,
+            details={"bid_sum": bid_sum, "fee_bps": float(market.fee_bps or 0)},
+        )
 
-    def _edge_meets_threshold(self, edge: float) -> bool:
-        threshold = self.min_edge_bps / 10_000
-        return edge >= threshold
+    def market_book(self, market_id: str) -> Optional[MarketBook]:
+        """Look up a single market's live book without building a snapshot."""
 
-    def _best_opportunity(self, opportunities: List[CompleteSetOpportunity]) -> Optional[CompleteSetOpportunity]:
-        if not opportunities:
-            return None
-        return max(opportunities, key=lambda opp: opp.edge)
+        return self._markets.get(market_id)
 
     def snapshot(self) -> Dict[str, MarketBook]:
         """Expose current market state for downstream usage or debugging."""
@@ -1,7 +1,12 @@
 """Inventory and position caps."""
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 
 @dataclass
@@ -15,3 +20,16 @@ class InventoryCaps:
 
         cap = self.caps.get(symbol)
         return cap is not None and abs(proposed_inventory) <= cap
+
+    def within_caps_batch(self, symbols: Sequence[str], proposed: "np.ndarray") -> "np.ndarray":
+        """Vectorized :meth:`within_caps` over parallel symbol/inventory arrays.
+
+        Symbols without a configured cap fail the check, matching the scalar
+        path. Requires numpy; callers fall back to the scalar loop otherwise.
+        """
+
+        # -1 is an impossible cap, so missing symbols compare False for free.
+        caps = np.fromiter(
+            (self.caps.get(symbol, -1.0) for symbol in symbols), dtype=float, count=len(symbols)
+        )
+        return np.abs(proposed) <= caps
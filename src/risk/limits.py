@@ -1,7 +1,12 @@
 """Basic risk limits and validation."""
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 
 @dataclass
@@ -18,6 +23,21 @@ class RiskLimits:
         max_size = self.max_position_sizes.get(symbol)
         return max_size is not None and abs(proposed_size) <= max_size
 
+    def validate_position_batch(self, symbols: Sequence[str], proposed: "np.ndarray") -> "np.ndarray":
+        """Vectorized :meth:`validate_position` over parallel arrays.
+
+        Symbols without a configured limit fail the check, matching the
+        scalar path. Requires numpy; callers fall back otherwise.
+        """
+
+        # -1 is an impossible limit, so missing symbols compare False for free.
+        limits = np.fromiter(
+            (self.max_position_sizes.get(symbol, -1.0) for symbol in symbols),
+            dtype=float,
+            count=len(symbols),
+        )
+        return np.abs(proposed) <= limits
+
     def validate_loss(self, realized_loss_usd: float) -> bool:
         """Return True when realized loss is under the daily cap."""
 
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionPnL:
     """PnL for a single trading symbol."""
 